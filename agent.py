@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+
 from google.adk import Agent
 from google.adk.tools import agent_tool
 from google.adk.tools import VertexAiSearchTool
@@ -28,7 +30,10 @@ from .data_engineering_copilot.bigquery_tools import (
     get_query_execution_plan,
     estimate_query_cost,
     check_data_freshness,
+    check_dataset_freshness,
     analyze_bigquery_error,
+    bulk_analyze_bigquery_job,
+    bulk_analyze_bigquery_errors,
     find_failed_bigquery_jobs,
     suggest_query_optimization,
 )
@@ -59,7 +64,9 @@ from .data_engineering_copilot.gcs_tools import (
 )
 from .data_engineering_copilot.github_tools import (
     read_file_from_github,
+    read_files_from_github,
     write_file_to_github,
+    write_files_to_github,
     create_github_branch,
     create_github_pull_request,
     list_github_files,
@@ -77,6 +84,7 @@ from .data_engineering_copilot.dbt_tools import (
     dbt_build,
     dbt_docs_generate,
     dbt_docs_serve,
+    dbt_docs_stop,
     dbt_seed,
     dbt_snapshot,
     dbt_ls,
@@ -86,6 +94,7 @@ from .data_engineering_copilot.dbt_tools import (
     dbt_run_operation,
     dbt_source_freshness,
     dbt_parse,
+    dbt_run_many,
 )
 from .data_engineering_copilot.dataproc_tools import (
     create_dataproc_cluster,
@@ -105,6 +114,7 @@ from .data_engineering_copilot.databricks_tools import (
     delete_databricks_cluster,
     submit_databricks_pyspark_job,
     submit_databricks_notebook_job,
+    submit_databricks_batch,
     check_databricks_job_status,
     list_databricks_jobs,
     get_databricks_job_runs,
@@ -113,19 +123,37 @@ from .data_engineering_copilot.databricks_tools import (
 # Define a tool configuration to block any write operations
 tool_config = BigQueryToolConfig(write_mode=WriteMode.BLOCKED)
 
-application_default_credentials, _ = google.auth.default()
-credentials_config = BigQueryCredentialsConfig(
-    credentials=application_default_credentials
-)
 
-bigquery_toolset = BigQueryToolset(
-    credentials_config=credentials_config, bigquery_tool_config=tool_config
-)
+@functools.lru_cache(maxsize=1)
+def _get_adc():
+  """Discover application default credentials once per process.
 
-root_agent = Agent(
-    model=config.root_agent_model,
-    name="data_engineering_agent",
-    instruction=f"""
+  ADC discovery can involve a metadata-server round trip or credential-file
+  parsing; caching it avoids repeating that on uvicorn reloads or when this
+  module is re-imported by forked workers.
+  """
+  credentials, _ = google.auth.default()
+  return credentials
+
+
+@functools.lru_cache(maxsize=1)
+def _get_bq_toolset() -> BigQueryToolset:
+  """Build the BigQuery toolset once per process."""
+  credentials_config = BigQueryCredentialsConfig(credentials=_get_adc())
+  return BigQueryToolset(
+      credentials_config=credentials_config, bigquery_tool_config=tool_config
+  )
+
+
+bigquery_toolset = _get_bq_toolset()
+
+# The instruction is static for a given config, so it is assembled exactly
+# once at import time into this constant instead of inline in the Agent call.
+# Gemini context caching (CachedContent) is not wired up here because the ADK
+# Agent API does not currently accept a cached_content handle; when it does,
+# this constant is the block to cache so the model stops re-encoding it on
+# every turn.
+ROOT_AGENT_INSTRUCTION = f"""
       You are a comprehensive data engineering expert supporting BigQuery, Dataform, dbt, PySpark/Dataproc, and Databricks.
 
       You can work with multiple data engineering tools:
@@ -213,6 +241,8 @@ root_agent = Agent(
 
       GitHub Integration:
       - When making changes to Dataform files, you can optionally sync them to GitHub.
+      - When you need to read several GitHub files, use read_files_from_github with the full list of paths (one batched request) instead of calling read_file_from_github once per file.
+      - When committing several files, use write_files_to_github with the full list (one atomic commit) instead of calling write_file_to_github once per file.
       - Use create_github_branch to create a feature branch before making changes.
       - Use write_file_to_github to commit changes directly to GitHub.
       - Use sync_dataform_to_github to keep Dataform and GitHub in sync.
@@ -220,7 +250,12 @@ root_agent = Agent(
       - After a PR is merged, use delete_github_branch to clean up the feature branch.
       - Use cleanup_merged_branches to automatically delete all merged feature branches.
       - Always use meaningful commit messages that describe what was changed and why.
-    """,
+    """
+
+root_agent = Agent(
+    model=config.root_agent_model,
+    name="data_engineering_agent",
+    instruction=ROOT_AGENT_INSTRUCTION,
     tools=[
         write_file_to_dataform,
         compile_dataform,
@@ -240,7 +275,10 @@ root_agent = Agent(
         get_query_execution_plan,
         estimate_query_cost,
         check_data_freshness,
+        check_dataset_freshness,
         analyze_bigquery_error,
+        bulk_analyze_bigquery_job,
+        bulk_analyze_bigquery_errors,
         find_failed_bigquery_jobs,
         suggest_query_optimization,
         validate_bucket_exists_tool,
@@ -248,7 +286,9 @@ root_agent = Agent(
         list_bucket_files_tool,
         read_gcs_file_tool,
         read_file_from_github,
+        read_files_from_github,
         write_file_to_github,
+        write_files_to_github,
         create_github_branch,
         create_github_pull_request,
         list_github_files,
@@ -271,6 +311,7 @@ root_agent = Agent(
         dbt_build,
         dbt_docs_generate,
         dbt_docs_serve,
+        dbt_docs_stop,
         dbt_seed,
         dbt_snapshot,
         dbt_ls,
@@ -280,6 +321,7 @@ root_agent = Agent(
         dbt_run_operation,
         dbt_source_freshness,
         dbt_parse,
+        dbt_run_many,
         # Dataproc/PySpark tools
         create_dataproc_cluster,
         list_dataproc_clusters,
@@ -297,6 +339,7 @@ root_agent = Agent(
         delete_databricks_cluster,
         submit_databricks_pyspark_job,
         submit_databricks_notebook_job,
+        submit_databricks_batch,
         check_databricks_job_status,
         list_databricks_jobs,
         get_databricks_job_runs,
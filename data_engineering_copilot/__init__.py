@@ -12,12 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .bigquery_tools import *
-from .dataform_tools import *
-from .github_tools import *
-from .dbt_tools import *
-from .dataproc_tools import *
-from .databricks_tools import *
+"""Lazily-loading package facade for the copilot tool modules.
+
+Each tool submodule transitively imports a heavyweight SDK (google-cloud-*,
+databricks-sdk, PyGithub, dbt). Importing all of them eagerly costs seconds
+of startup time and hundreds of MB of resident code even when a process only
+ever touches one category, so submodules are resolved on first attribute
+access instead (PEP 562).
+"""
+
+import importlib
 
 __all__ = [
     'write_file_to_dataform',
@@ -27,7 +31,9 @@ __all__ = [
     'read_file_from_dataform',
     'get_udf_sp_tool',
     'read_file_from_github',
+    'read_files_from_github',
     'write_file_to_github',
+    'write_files_to_github',
     'create_github_branch',
     'create_github_pull_request',
     'list_github_files',
@@ -42,8 +48,11 @@ __all__ = [
     'get_query_execution_plan',
     'estimate_query_cost',
     'check_data_freshness',
+    'check_dataset_freshness',
     # BigQuery debugging and error analysis tools
     'analyze_bigquery_error',
+    'bulk_analyze_bigquery_job',
+    'bulk_analyze_bigquery_errors',
     'find_failed_bigquery_jobs',
     'suggest_query_optimization',
     # Dataform monitoring and quality tools
@@ -60,6 +69,7 @@ __all__ = [
     'dbt_build',
     'dbt_docs_generate',
     'dbt_docs_serve',
+    'dbt_docs_stop',
     'dbt_seed',
     'dbt_snapshot',
     'dbt_ls',
@@ -69,6 +79,7 @@ __all__ = [
     'dbt_run_operation',
     'dbt_source_freshness',
     'dbt_parse',
+    'dbt_run_many',
     # Dataproc/PySpark tools
     'create_dataproc_cluster',
     'list_dataproc_clusters',
@@ -86,7 +97,139 @@ __all__ = [
     'delete_databricks_cluster',
     'submit_databricks_pyspark_job',
     'submit_databricks_notebook_job',
+    'submit_databricks_batch',
     'check_databricks_job_status',
     'list_databricks_jobs',
     'get_databricks_job_runs',
 ]
+
+# Which submodule defines each exported name. Names not in __all__ (helpers
+# like get_bigquery_client or the gcs tools imported directly by agent.py)
+# are included so previous star-import behavior is preserved.
+_SUBMODULE_EXPORTS = {
+    'bigquery_tools': (
+        'get_bigquery_client',
+        'bigquery_job_details_tool',
+        'get_udf_sp_tool',
+        'validate_table_data',
+        'sample_table_data_tool',
+        'analyze_query_performance',
+        'get_query_execution_plan',
+        'estimate_query_cost',
+        'check_data_freshness',
+        'check_dataset_freshness',
+        'analyze_bigquery_error',
+        'bulk_analyze_bigquery_job',
+        'bulk_analyze_bigquery_errors',
+        'find_failed_bigquery_jobs',
+        'suggest_query_optimization',
+    ),
+    'dataform_tools': (
+        'write_file_to_dataform',
+        'delete_file_from_dataform',
+        'compile_dataform',
+        'read_file_from_dataform',
+        'search_files_in_dataform',
+        'get_dataform_execution_logs',
+        'execute_dataform_workflow',
+        'execute_dataform_by_tags',
+        'read_workflow_settings',
+        'get_workflow_status',
+        'get_dataform_repo_link',
+        'monitor_workflow_health',
+        'get_failed_workflows',
+        'check_pipeline_health',
+        'generate_pipeline_documentation',
+        'analyze_assertion_results',
+        'check_data_quality_anomalies',
+    ),
+    'gcs_tools': (
+        'get_gcs_client',
+        'validate_bucket_exists_tool',
+        'validate_file_exists_tool',
+        'list_bucket_files_tool',
+        'read_gcs_file_tool',
+    ),
+    'github_tools': (
+        'read_file_from_github',
+        'read_files_from_github',
+        'write_file_to_github',
+        'write_files_to_github',
+        'create_github_branch',
+        'create_github_pull_request',
+        'list_github_files',
+        'get_github_file_history',
+        'sync_dataform_to_github',
+        'delete_github_branch',
+        'get_merged_pull_requests',
+        'cleanup_merged_branches',
+        'create_github_repository',
+    ),
+    'dbt_tools': (
+        'dbt_run',
+        'dbt_test',
+        'dbt_compile',
+        'dbt_build',
+        'dbt_docs_generate',
+        'dbt_docs_serve',
+        'dbt_docs_stop',
+        'dbt_seed',
+        'dbt_snapshot',
+        'dbt_ls',
+        'dbt_show',
+        'dbt_debug',
+        'dbt_deps',
+        'dbt_run_operation',
+        'dbt_source_freshness',
+        'dbt_parse',
+        'dbt_run_many',
+    ),
+    'dataproc_tools': (
+        'create_dataproc_cluster',
+        'list_dataproc_clusters',
+        'get_dataproc_cluster_details',
+        'delete_dataproc_cluster',
+        'submit_pyspark_job',
+        'check_dataproc_job_status',
+        'list_dataproc_jobs',
+        'create_dataproc_serverless_batch',
+        'check_dataproc_serverless_batch_status',
+    ),
+    'databricks_tools': (
+        'create_databricks_cluster',
+        'list_databricks_clusters',
+        'get_databricks_cluster_status',
+        'delete_databricks_cluster',
+        'submit_databricks_pyspark_job',
+        'submit_databricks_notebook_job',
+        'submit_databricks_batch',
+        'check_databricks_job_status',
+        'list_databricks_jobs',
+        'get_databricks_job_runs',
+    ),
+}
+
+_MODULE_BY_NAME = {
+    name: module
+    for module, names in _SUBMODULE_EXPORTS.items()
+    for name in names
+}
+
+
+def __getattr__(name):
+    """Resolve tool names (and submodules) on first access, then cache them."""
+    module_name = _MODULE_BY_NAME.get(name)
+    if module_name is not None:
+        module = importlib.import_module(f".{module_name}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name in _SUBMODULE_EXPORTS:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULE_BY_NAME) | set(_SUBMODULE_EXPORTS))
@@ -0,0 +1,43 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared HTTP connection pooling for the copilot tool modules.
+
+Tool calls are dominated by small REST requests; creating a fresh transport
+per call pays TCP + TLS setup (roughly 50-150 ms) every time. This module
+owns one pooled ``requests.Session`` per process so REST-based tools reuse
+warm connections across calls. The gRPC-based Google Cloud clients already
+multiplex a single channel and don't need this.
+"""
+
+import functools
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Sized for bursts from /agent/run_batch fan-out plus concurrent agent runs.
+POOL_CONNECTIONS = 50
+POOL_MAXSIZE = 50
+
+
+@functools.lru_cache(maxsize=1)
+def get_shared_session() -> requests.Session:
+    """Return the process-wide pooled requests session."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
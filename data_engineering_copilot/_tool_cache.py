@@ -0,0 +1,95 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Short-TTL result caching for read-only tool functions.
+
+Inside a single agent loop the model routinely re-invokes the same
+introspective tool (read a file, list files, fetch the repo link) with
+identical arguments; every call round-trips a remote API. Wrapping those
+tools with ``cached_read_tool`` answers repeats from memory for a short TTL,
+and mutating tools invalidate the cache group whose reads they can affect.
+"""
+
+import functools
+import os
+import threading
+import time
+
+DEFAULT_TTL = float(os.getenv("TOOL_CACHE_TTL", "60"))
+
+# group name -> {call key: (expires_at, value)}
+_CACHES = {}
+_LOCK = threading.Lock()
+
+
+def invalidate_group(*groups: str) -> None:
+    """Drop all cached results for the given cache groups."""
+    with _LOCK:
+        for group in groups:
+            _CACHES.pop(group, None)
+
+
+def _is_error_result(value) -> bool:
+    """Heuristic for the error shapes the wrapped tools return.
+
+    The read tools signal failure three ways: a {"status": "error"} dict,
+    a plain "Error: ..." string, or a single-element ["Error: ..."] list.
+    """
+    if isinstance(value, dict):
+        return value.get("status") == "error"
+    if isinstance(value, str):
+        return value.startswith("Error")
+    if isinstance(value, list):
+        return bool(value) and isinstance(value[0], str) and value[0].startswith("Error")
+    return False
+
+
+def cached_read_tool(group: str, ttl: float = DEFAULT_TTL):
+    """Memoize a read-only tool's results per argument tuple for ``ttl`` seconds.
+
+    Args:
+        group (str): Cache group this tool belongs to; mutating tools call
+            invalidate_group(group) to flush it.
+        ttl (float): Seconds a cached result stays valid. Defaults to
+            TOOL_CACHE_TTL (60s).
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                # Unhashable argument (e.g. a list) - skip caching.
+                return func(*args, **kwargs)
+
+            now = time.monotonic()
+            with _LOCK:
+                cache = _CACHES.get(group)
+                entry = cache.get(key) if cache else None
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+            value = func(*args, **kwargs)
+            # Only successful results are cached; a transient API error
+            # should not be replayed for the rest of the TTL.
+            if not _is_error_result(value):
+                with _LOCK:
+                    _CACHES.setdefault(group, {})[key] = (now + ttl, value)
+            return value
+
+        return wrapper
+
+    return decorator
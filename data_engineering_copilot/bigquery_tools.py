@@ -20,11 +20,21 @@ information schema, finding relevant datasets, and validating data within tables
 based on user-defined rules.
 """
 
+import dataclasses
+import functools
+import hashlib
 import json
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
+import google.auth
+from cachetools import TTLCache
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import bigquery
 from google.adk.tools import agent_tool
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from datetime import datetime, timezone
 import sys
 import os
 
@@ -32,9 +42,122 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import config
 
+from . import _http
+
+try:
+  import orjson
+except ImportError:  # optional; the stdlib encoder is the fallback
+  orjson = None
+
+# Binary unit constants, so byte math reads uniformly and hot paths don't
+# re-evaluate ``1024 ** n`` per call.
+_BYTES_PER_GB = 1 << 30
+_BYTES_PER_TB = 1 << 40
+
+# Reciprocals for the freshness math: one multiply per conversion instead
+# of a float division, and no magic numbers inline.
+_INV_3600 = 1.0 / 3600.0
+_INV_24 = 1.0 / 24.0
+
+
+# round() goes through generic float dispatch and banker's rounding; the
+# freshness and cost reports only need fixed decimal places on
+# non-negative values, which one multiply/add/truncate covers.
+def _r1(x: float) -> float:
+  return int(x * 10 + 0.5) / 10
+
+
+def _r2(x: float) -> float:
+  return int(x * 100 + 0.5) / 100
+
+
+def _r4(x: float) -> float:
+  return int(x * 10000 + 0.5) / 10000
+
+
+def _dumps(obj: Any) -> str:
+  """Serialize to indented JSON, preferring orjson's C encoder.
+
+  Routine listings and table samples can run to multiple MB; orjson
+  serializes them (datetimes included, no per-value ``default=str``
+  callback) several times faster than ``json.dumps(indent=2)`` and writes
+  bytes directly instead of accumulating str chunks.
+  """
+  if orjson is not None:
+    try:
+      return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+    except TypeError:
+      pass
+  return json.dumps(obj, indent=2, default=str)
+
+@functools.lru_cache(maxsize=4)
+def _build_bigquery_client(project_id: str, location: Optional[str]) -> bigquery.Client:
+  """Build one client per (project, location) and reuse it.
+
+  Every tool used to construct a fresh ``bigquery.Client``, re-running
+  credential discovery and transport setup on each call — blocking work that
+  dwarfs the actual RPC for small lookups like ``get_job``. The client owns a
+  pooled HTTP session, so reusing it is the REST equivalent of channel reuse.
+  The client is thread-safe, so sharing across the tool executor pools is
+  fine.
+  """
+  # Back the client with an explicitly pooled AuthorizedSession. The
+  # default transport keeps only a handful of urllib3 connections, so
+  # concurrent tool fan-out serializes on socket creation once the pool
+  # saturates; sizing it like the shared GitHub session keeps parallel
+  # queries on warm connections.
+  credentials, _ = google.auth.default()
+  session = AuthorizedSession(credentials)
+  adapter = HTTPAdapter(
+      pool_connections=_http.POOL_CONNECTIONS,
+      pool_maxsize=_http.POOL_MAXSIZE,
+  )
+  session.mount("https://", adapter)
+  session.mount("http://", adapter)
+  client = bigquery.Client(project=project_id, location=location, _http=session)
+  # Let the backend skip job creation for short queries (jobs.query fast
+  # path). Only supported by newer google-cloud-bigquery releases.
+  if hasattr(client, "default_job_creation_mode"):
+    client.default_job_creation_mode = "JOB_CREATION_OPTIONAL"
+  return client
+
+
 def get_bigquery_client() -> bigquery.Client:
   """Get a configured BigQuery client."""
-  return bigquery.Client(project=config.project_id)
+  return _build_bigquery_client(config.project_id, getattr(config, "location", None))
+
+
+def _run_query(client: bigquery.Client, query: str, job_config=None):
+  """Run a query and return its row iterator.
+
+  Uses ``query_and_wait`` (google-cloud-bigquery >= 3.15) when available: it
+  calls the synchronous ``jobs.query`` API and, combined with optional job
+  creation, avoids the insert-then-poll round trips of
+  ``client.query().result()`` that add multiple seconds even to tiny queries.
+  Falls back to the classic path on older client versions.
+  """
+  if hasattr(client, "query_and_wait"):
+    # A large page size amortizes REST pagination for result sets that
+    # span multiple pages; single-row aggregates are unaffected.
+    return client.query_and_wait(query, job_config=job_config, page_size=10_000)
+  return client.query(query, job_config=job_config).result(page_size=10_000)
+
+
+def _rows_to_dicts(results) -> List[Dict[str, Any]]:
+  """Materialize a result set as a list of dicts.
+
+  Prefers the columnar ``to_arrow`` path: decoding happens in vectorized C
+  code and ``to_pylist`` builds the dicts, which beats a per-row
+  ``dict(row.items())`` comprehension by a wide margin on big or wide
+  results. Falls back to the row iterator when pyarrow is unavailable.
+  """
+  to_arrow = getattr(results, "to_arrow", None)
+  if to_arrow is not None:
+    try:
+      return to_arrow(progress_bar_type=None).to_pylist()
+    except Exception:
+      pass  # pyarrow missing or a type it can't map; use the row iterator.
+  return [dict(row.items()) for row in results]
 
 def bigquery_job_details_tool(job_id: str) -> Dict[str, Any]:
   """Retrieve details of a BigQuery job.
@@ -62,21 +185,44 @@ def bigquery_job_details_tool(job_id: str) -> Dict[str, Any]:
   except Exception as e:
     return {"error": f"Error getting job details: {e}"}
 
-def get_udf_sp_tool(dataset_id: str, routine_type: Optional[str] = None) -> str:
+# Routine metadata changes on the order of hours, yet agent sessions ask
+# for the same dataset's routines repeatedly; a 15-minute TTL turns those
+# repeats into dict lookups instead of INFORMATION_SCHEMA scans.
+_ROUTINE_CACHE: TTLCache = TTLCache(maxsize=128, ttl=900)
+
+
+def get_udf_sp_tool(
+    dataset_id: str,
+    routine_type: Optional[str] = None,
+    force_refresh: bool = False,
+) -> str:
   """Retrieve UDFs and Stored Procedures from a BigQuery dataset.
 
   Args:
       dataset_id (str): The dataset ID to search.
       routine_type (Optional[str]): Filter by routine type ('FUNCTION' or
         'PROCEDURE').
+      force_refresh (bool): Bypass the 15-minute metadata cache and query
+        INFORMATION_SCHEMA again.
 
   Returns:
       str: JSON string containing routine information.
   """
+  cache_key = (dataset_id, routine_type)
+  if not force_refresh:
+    cached = _ROUTINE_CACHE.get(cache_key)
+    if cached is not None:
+      return cached
+
   client = get_bigquery_client()
 
+  try:
+    _check_identifier(dataset_id, "dataset_id")
+  except ValueError as e:
+    return json.dumps({"error": str(e)}, indent=2)
+
   query = f"""
-        SELECT 
+        SELECT
             routine_name,
             routine_type,
             routine_body,
@@ -86,17 +232,22 @@ def get_udf_sp_tool(dataset_id: str, routine_type: Optional[str] = None) -> str:
             created,
             last_modified
         FROM `{config.project_id}.{dataset_id}.INFORMATION_SCHEMA.ROUTINES`
-        {f"WHERE routine_type = '{routine_type}'" if routine_type else ""}
+        {"WHERE routine_type = @routine_type" if routine_type else ""}
         ORDER BY routine_type, routine_name
     """
 
+  job_config = bigquery.QueryJobConfig(use_query_cache=True)
+  if routine_type:
+    job_config.query_parameters = [
+        bigquery.ScalarQueryParameter("routine_type", "STRING", routine_type)
+    ]
+
   try:
-    query_job = client.query(query)
-    results = query_job.result()
-    routine_info_list = [dict(row.items()) for row in results]
+    results = _run_query(client, query, job_config=job_config)
+    routine_info_list = _rows_to_dicts(results)
 
     if not routine_info_list:
-      return json.dumps(
+      payload = json.dumps(
           {
               "message": (
                   f"No {'UDFs' if routine_type == 'FUNCTION' else 'Stored Procedures' if routine_type == 'PROCEDURE' else 'routines'} found"
@@ -105,8 +256,12 @@ def get_udf_sp_tool(dataset_id: str, routine_type: Optional[str] = None) -> str:
           },
           indent=2,
       )
+    else:
+      payload = _dumps(routine_info_list)
 
-    return json.dumps(routine_info_list, indent=2, default=str)
+    # Only successful lookups are cached; errors always retry.
+    _ROUTINE_CACHE[cache_key] = payload
+    return payload
 
   except Exception as e:
     return json.dumps(
@@ -119,69 +274,208 @@ def get_udf_sp_tool(dataset_id: str, routine_type: Optional[str] = None) -> str:
     )
 
 
+# Datasets, tables and columns cannot be query parameters, so identifiers
+# that reach SQL text are whitelisted instead. Values always travel as
+# parameters: beyond the injection guard, parameterized SQL keeps its text
+# stable across invocations, which is what lets BigQuery's (free) result
+# cache hit on the repeated calls agents tend to make.
+_IDENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _check_identifier(name: str, kind: str = "identifier") -> str:
+  """Validate a SQL identifier that cannot be parameterized."""
+  if not name or not _IDENT_RE.match(name):
+    raise ValueError(f"Invalid {kind}: {name!r}")
+  return name
+
+
+def _scalar_param(name: str, value: Any) -> bigquery.ScalarQueryParameter:
+  """Build a typed query parameter from a Python validation-rule value."""
+  if isinstance(value, bool):
+    param_type = "BOOL"
+  elif isinstance(value, int):
+    param_type = "INT64"
+  elif isinstance(value, float):
+    param_type = "FLOAT64"
+  else:
+    param_type = "STRING"
+  return bigquery.ScalarQueryParameter(name, param_type, value)
+
+
+# Cap on how long a validation query may run before the tool gives up.
+_VALIDATION_TIMEOUT = float(os.getenv("BQ_VALIDATION_TIMEOUT", "300"))
+
+
+def _single_row(client: bigquery.Client, query: str, job_config=None):
+  """Fetch exactly one row from an aggregate query.
+
+  ``result()`` with defaults buffers a whole first page and sets up
+  pagination; for single-row aggregates ``max_results=1, page_size=1``
+  skips that, and the timeout keeps a runaway validation from hanging the
+  tool.
+  """
+  if hasattr(client, "query_and_wait"):
+    results = client.query_and_wait(
+        query,
+        job_config=job_config,
+        max_results=1,
+        page_size=1,
+        wait_timeout=_VALIDATION_TIMEOUT,
+    )
+  else:
+    results = client.query(query, job_config=job_config).result(
+        max_results=1, page_size=1, timeout=_VALIDATION_TIMEOUT
+    )
+  return next(iter(results))
+
+
 def validate_table_data(
-    dataset_id: str, table_id: str, rules: List[Dict[str, Any]]
+    dataset_id: str, table_id: str, rules: List[Dict[str, Any]],
+    priority: str = "batch",
 ) -> Dict[str, Any]:
   """Validate data in a BigQuery table against specified rules.
 
+  All rules are evaluated in a single query via conditional aggregation
+  (one ``COUNTIF``/distinct-count expression per rule), so the table is
+  scanned once instead of once per rule and only one job round trip is
+  paid regardless of how many rules are checked.
+
   Args:
       dataset_id (str): The dataset ID.
       table_id (str): The table ID.
       rules (List[Dict[str, Any]]): List of validation rules.
+      priority (str): 'batch' (default) or 'interactive'. Batch jobs don't
+        count against the interactive concurrency quota and so survive
+        quota pressure, at the cost of minutes rather than seconds of
+        scheduling latency; pass 'interactive' when the result is needed
+        immediately.
 
   Returns:
       Dict[str, Any]: Validation results.
   """
   client = get_bigquery_client()
-  validation_results = []
+  job_priority = (
+      bigquery.QueryPriority.INTERACTIVE
+      if priority == "interactive"
+      else bigquery.QueryPriority.BATCH
+  )
 
-  for rule in rules:
-    try:
-      column = rule["column"]
-      rule_type = rule["type"]
-      value = rule.get("value")
-
-      if rule_type == "not_null":
-        query = f"""
-                    SELECT COUNT(*) as null_count
-                    FROM `{config.project_id}.{dataset_id}.{table_id}`
-                    WHERE {column} IS NULL
-                """
-      elif rule_type == "unique":
-        query = f"""
-                    SELECT {column}, COUNT(*) as count
-                    FROM `{config.project_id}.{dataset_id}.{table_id}`
-                    GROUP BY {column}
-                    HAVING COUNT(*) > 1
-                """
-      elif rule_type == "value":
-        query = f"""
-                    SELECT COUNT(*) as invalid_count
-                    FROM `{config.project_id}.{dataset_id}.{table_id}`
-                    WHERE {column} != {value}
-                """
-      else:
-        validation_results.append({
-            "rule": rule,
-            "status": "error",
-            "message": f"Unknown rule type: {rule_type}",
-        })
-        continue
+  try:
+    _check_identifier(dataset_id, "dataset_id")
+    _check_identifier(table_id, "table_id")
+  except ValueError as e:
+    return {
+        "dataset": dataset_id,
+        "table": table_id,
+        "validations": [],
+        "error": str(e),
+    }
 
-      query_job = client.query(query)
-      results = query_job.result()
-      row = next(iter(results))
+  validation_results: List[Optional[Dict[str, Any]]] = [None] * len(rules)
 
-      validation_results.append({
+  params = []
+  metric_rules = []  # (result index, column alias, rule, expression, params)
+
+  for index, rule in enumerate(rules):
+    column = rule.get("column")
+    rule_type = rule.get("type")
+    alias = f"r{index}"
+
+    if not column or not _IDENT_RE.match(column):
+      validation_results[index] = {
           "rule": rule,
-          "status": "pass" if row[0] == 0 else "fail",
-          "details": dict(row.items()),
-      })
+          "status": "error",
+          "message": f"Missing or invalid column: {column!r}",
+      }
+      continue
+
+    if rule_type == "not_null":
+      expr = f"COUNTIF({column} IS NULL) AS {alias}"
+      rule_params = []
+    elif rule_type == "unique":
+      # Rows in excess of distinct non-null values; 0 means no duplicates.
+      expr = f"COUNT({column}) - COUNT(DISTINCT {column}) AS {alias}"
+      rule_params = []
+    elif rule_type == "value":
+      # Parameterized so literal values don't change the SQL text (keeps
+      # the result cache warm) and can't break out of the query.
+      param_name = f"{alias}_value"
+      expr = f"COUNTIF({column} != @{param_name}) AS {alias}"
+      rule_params = [_scalar_param(param_name, rule.get("value"))]
+    else:
+      validation_results[index] = {
+          "rule": rule,
+          "status": "error",
+          "message": f"Unknown rule type: {rule_type}",
+      }
+      continue
+
+    params.extend(rule_params)
+    metric_rules.append((index, alias, rule, expr, rule_params))
 
-    except Exception as e:
-      validation_results.append(
-          {"rule": rule, "status": "error", "message": str(e)}
+  if metric_rules:
+    table_ref = f"`{config.project_id}.{dataset_id}.{table_id}`"
+    query = f"""
+            SELECT {', '.join(expr for _, _, _, expr, _ in metric_rules)}
+            FROM {table_ref}
+        """
+    try:
+      job_config = bigquery.QueryJobConfig(
+          priority=job_priority, use_query_cache=True
       )
+      if params:
+        job_config.query_parameters = params
+      row = _single_row(client, query, job_config=job_config)
+
+      for index, alias, rule, _, _ in metric_rules:
+        violations = row[alias]
+        validation_results[index] = {
+            "rule": rule,
+            "status": "pass" if violations == 0 else "fail",
+            "details": {"violation_count": violations},
+        }
+
+    except Exception:
+      # One bad rule (e.g. a typo'd column) fails the combined query for
+      # every rule. Recover per-rule isolation by submitting one job per
+      # rule up front and only then collecting results, so the retry costs
+      # ~max(rule latency) in wall time instead of the sum.
+      pending = []
+      for index, alias, rule, expr, rule_params in metric_rules:
+        rule_query = f"SELECT {expr} FROM {table_ref}"
+        try:
+          rule_config = bigquery.QueryJobConfig(
+              priority=job_priority, use_query_cache=True
+          )
+          if rule_params:
+            rule_config.query_parameters = rule_params
+          pending.append(
+              (index, alias, rule, client.query(rule_query, job_config=rule_config))
+          )
+        except Exception as e:
+          validation_results[index] = {
+              "rule": rule,
+              "status": "error",
+              "message": str(e),
+          }
+
+      for index, alias, rule, job in pending:
+        try:
+          row = next(iter(job.result(
+              max_results=1, page_size=1, timeout=_VALIDATION_TIMEOUT
+          )))
+          violations = row[alias]
+          validation_results[index] = {
+              "rule": rule,
+              "status": "pass" if violations == 0 else "fail",
+              "details": {"violation_count": violations},
+          }
+        except Exception as e:
+          validation_results[index] = {
+              "rule": rule,
+              "status": "error",
+              "message": str(e),
+          }
 
   return {
       "dataset": dataset_id,
@@ -195,8 +489,16 @@ def sample_table_data_tool(
     table_id: str,
     sample_size: int = 10,
     random_seed: Optional[int] = None,
+    columns: Optional[List[str]] = None,
 ) -> str:
-  """Sample data from a BigQuery table using RAND() function.
+  """Sample data from a BigQuery table using block-level TABLESAMPLE.
+
+  ``ORDER BY RAND() LIMIT n`` reads and sorts every row of every column
+  before returning a handful — dollars and tens of seconds on TB tables.
+  ``TABLESAMPLE SYSTEM`` prunes at the storage-block level instead, and an
+  explicit column list avoids scanning columns the caller doesn't want.
+  Block sampling can select zero blocks on small tables, in which case the
+  tool retries with a plain ``LIMIT`` scan (cheap at that size anyway).
 
   Args:
       dataset_id (str): The dataset ID.
@@ -204,48 +506,125 @@ def sample_table_data_tool(
       sample_size (int): Number of rows to sample. Defaults to 10.
       random_seed (Optional[int]): Seed for random sampling. If provided,
         ensures reproducible results.
+      columns (Optional[List[str]]): Project only these columns. Defaults to
+        all columns.
 
   Returns:
       str: JSON string containing sampled data.
   """
   try:
     client = get_bigquery_client()
+    _check_identifier(dataset_id, "dataset_id")
+    _check_identifier(table_id, "table_id")
 
-    # Build the query with optional random seed
-    seed_clause = (
-        f"SET @seed = {random_seed};" if random_seed is not None else ""
-    )
-    query = f"""
-            {seed_clause}
-            SELECT *
-            FROM `{config.project_id}.{dataset_id}.{table_id}`
-            ORDER BY {'RAND(@seed)' if random_seed is not None else 'RAND()'}
-            LIMIT {sample_size}
+    if columns:
+      select_list = ", ".join(
+          _check_identifier(column, "column") for column in columns
+      )
+    else:
+      select_list = "*"
+
+    table_ref = f"`{config.project_id}.{dataset_id}.{table_id}`"
+    params = [bigquery.ScalarQueryParameter("sample_size", "INT64", sample_size)]
+
+    if random_seed is not None:
+      # TABLESAMPLE takes no seed, so reproducible samples filter on a
+      # deterministic fingerprint bucket instead. Still a full scan, but
+      # only of the projected columns and with no global sort.
+      query = f"""
+            SELECT {select_list}
+            FROM {table_ref} AS t
+            WHERE MOD(ABS(FARM_FINGERPRINT(TO_JSON_STRING(t))), 100) = @seed_bucket
+            LIMIT @sample_size
+        """
+      params.append(
+          bigquery.ScalarQueryParameter("seed_bucket", "INT64", random_seed % 100)
+      )
+    else:
+      query = f"""
+            SELECT {select_list}
+            FROM {table_ref} TABLESAMPLE SYSTEM (1 PERCENT)
+            LIMIT @sample_size
         """
 
-    query_job = client.query(query)
-    results = query_job.result()
+    job_config = bigquery.QueryJobConfig(
+        use_query_cache=True,
+        query_parameters=params,
+    )
+    results = _run_query(client, query, job_config=job_config)
 
     # Convert results to list of dictionaries
-    sample_data = [dict(row.items()) for row in results]
+    sample_data = _rows_to_dicts(results)
+
+    if not sample_data and random_seed is None:
+      # TABLESAMPLE works at block granularity and routinely picks zero
+      # blocks on small tables; fall back to a plain LIMIT scan so a
+      # non-empty table never samples as empty.
+      query = f"""
+            SELECT {select_list}
+            FROM {table_ref}
+            LIMIT @sample_size
+        """
+      results = _run_query(client, query, job_config=job_config)
+      sample_data = _rows_to_dicts(results)
 
-    return json.dumps(
-        {
-            "status": "success",
-            "dataset": dataset_id,
-            "table": table_id,
-            "sample_size": sample_size,
-            "random_seed": random_seed,
-            "data": sample_data,
-        },
-        indent=2,
-        default=str,
-    )
+    return _dumps({
+        "status": "success",
+        "dataset": dataset_id,
+        "table": table_id,
+        "sample_size": sample_size,
+        "random_seed": random_seed,
+        "data": sample_data,
+    })
 
   except Exception as e:
     return json.dumps({"status": "error", "error": str(e)}, indent=2)
 
 
+# Finished jobs are fetched once per process and shared by the analyzers:
+# chaining performance -> plan -> error analysis (which the docstrings
+# encourage) used to pay three identical get_job round trips. Non-terminal
+# jobs are always re-fetched. Bounded FIFO.
+_JOB_SNAPSHOT_CACHE: Dict[str, Any] = {}
+_JOB_SNAPSHOT_MAX = 256
+
+
+def _fetch_job(client: bigquery.Client, job_id: str):
+  """Fetch a job, reusing the cached object once the job is DONE."""
+  job = _JOB_SNAPSHOT_CACHE.get(job_id)
+  if job is not None:
+    return job
+
+  # Handle different job_id formats
+  if ':' in job_id and '.' in job_id:
+    # Full format: project:location.job_id
+    job = client.get_job(job_id)
+  else:
+    # Just job_id, need to construct full path
+    job = client.get_job(job_id, location=config.location)
+
+  if job.state == "DONE":
+    if len(_JOB_SNAPSHOT_CACHE) >= _JOB_SNAPSHOT_MAX:
+      _JOB_SNAPSHOT_CACHE.pop(next(iter(_JOB_SNAPSHOT_CACHE)))
+    _JOB_SNAPSHOT_CACHE[job_id] = job
+  return job
+
+
+# A BigQuery job is immutable once DONE — its metrics, plan and error never
+# change — yet debugging sessions re-analyze the same job many times. DONE
+# analyses are memoized so reanalysis is an in-memory lookup instead of a
+# get_job round trip. Bounded FIFO; running jobs are never cached.
+_JOB_ANALYSIS_CACHE: Dict[tuple, Dict[str, Any]] = {}
+_JOB_ANALYSIS_MAX = 256
+
+
+def _cache_job_analysis(key: tuple, result: Dict[str, Any]) -> Dict[str, Any]:
+  if len(_JOB_ANALYSIS_CACHE) >= _JOB_ANALYSIS_MAX:
+    _JOB_ANALYSIS_CACHE.pop(next(iter(_JOB_ANALYSIS_CACHE)))
+  _JOB_ANALYSIS_CACHE[key] = result
+  return result
+
+
 @agent_tool
 def analyze_query_performance(job_id: str) -> Dict[str, Any]:
   """Analyze BigQuery job performance metrics.
@@ -257,15 +636,14 @@ def analyze_query_performance(job_id: str) -> Dict[str, Any]:
       Dict[str, Any]: Performance metrics including bytes processed, slot usage, duration,
       cost estimate, and optimization suggestions.
   """
+  cache_key = ("performance", job_id)
+  cached = _JOB_ANALYSIS_CACHE.get(cache_key)
+  if cached is not None:
+    return cached
+
   client = get_bigquery_client()
   try:
-    # Handle different job_id formats
-    if ':' in job_id and '.' in job_id:
-      # Full format: project:location.job_id
-      job = client.get_job(job_id)
-    else:
-      # Just job_id, need to construct full path
-      job = client.get_job(job_id, location=config.location)
+    job = _fetch_job(client, job_id)
 
     if not isinstance(job, bigquery.QueryJob):
       return {
@@ -286,7 +664,8 @@ def analyze_query_performance(job_id: str) -> Dict[str, Any]:
       duration_seconds = (end_time - start_time).total_seconds()
 
     # Calculate cost (on-demand pricing: $5 per TB)
-    cost_usd = (total_bytes / (1024 ** 4)) * 5.0  # Convert bytes to TB, then multiply by $5
+    total_bytes_tb = total_bytes / _BYTES_PER_TB
+    cost_usd = total_bytes_tb * 5.0  # on-demand pricing: $5 per TB
 
     # Calculate slot efficiency
     slot_minutes = total_slot_ms / (1000 * 60) if total_slot_ms else 0
@@ -310,7 +689,7 @@ def analyze_query_performance(job_id: str) -> Dict[str, Any]:
 
     # Generate optimization suggestions
     suggestions = []
-    if total_bytes > 100 * (1024 ** 3):  # > 100 GB
+    if total_bytes > 100 * _BYTES_PER_GB:
       suggestions.append("Consider using partitioned tables to reduce bytes scanned")
     if total_slot_ms > 3600000:  # > 1 hour of slot time
       suggestions.append("Query may benefit from optimization - high slot usage detected")
@@ -319,13 +698,13 @@ def analyze_query_performance(job_id: str) -> Dict[str, Any]:
     if duration_seconds and duration_seconds > 300:  # > 5 minutes
       suggestions.append("Long-running query - consider optimizing JOINs or aggregations")
 
-    return {
+    result = {
         "status": "success",
         "job_id": job_id,
         "state": job.state,
         "performance_metrics": {
             "total_bytes_processed": total_bytes,
-            "total_bytes_processed_tb": round(total_bytes / (1024 ** 4), 4),
+            "total_bytes_processed_tb": round(total_bytes_tb, 4),
             "total_slot_ms": total_slot_ms,
             "duration_seconds": round(duration_seconds, 2) if duration_seconds else None,
             "creation_time": creation_time.isoformat() if creation_time else None,
@@ -334,13 +713,16 @@ def analyze_query_performance(job_id: str) -> Dict[str, Any]:
         },
         "cost_estimate": {
             "estimated_cost_usd": round(cost_usd, 4),
-            "bytes_processed_tb": round(total_bytes / (1024 ** 4), 4),
+            "bytes_processed_tb": round(total_bytes_tb, 4),
             "pricing_model": "on-demand ($5 per TB)",
         },
         "slot_efficiency": slot_efficiency,
         "error": error_info,
         "optimization_suggestions": suggestions,
     }
+    if job.state == "DONE":
+      return _cache_job_analysis(cache_key, result)
+    return result
 
   except Exception as e:
     return {
@@ -360,13 +742,14 @@ def get_query_execution_plan(job_id: str) -> Dict[str, Any]:
       Dict[str, Any]: Detailed execution plan including stages, operations, shuffle info,
       and bottleneck identification.
   """
+  cache_key = ("plan", job_id)
+  cached = _JOB_ANALYSIS_CACHE.get(cache_key)
+  if cached is not None:
+    return cached
+
   client = get_bigquery_client()
   try:
-    # Handle different job_id formats
-    if ':' in job_id and '.' in job_id:
-      job = client.get_job(job_id)
-    else:
-      job = client.get_job(job_id, location=config.location)
+    job = _fetch_job(client, job_id)
 
     if not isinstance(job, bigquery.QueryJob):
       return {
@@ -388,14 +771,21 @@ def get_query_execution_plan(job_id: str) -> Dict[str, Any]:
     total_slot_ms = 0
     max_shuffle_output = 0
 
+    # Plans can run to hundreds of stages; each hasattr() below was a
+    # try/except getattr followed by a second attribute fetch. A single
+    # getattr with a default halves the attribute machinery per field on
+    # this CPU-bound walk.
     for stage in query_plan:
+      parallel_inputs = getattr(stage, 'parallel_inputs', None)
       stage_info = {
           "name": stage.name,
           "id": stage.id,
           "steps": len(stage.steps) if stage.steps else 0,
           "input_stages": stage.input_stages if stage.input_stages else [],
-          "parallel_inputs": stage.parallel_inputs if hasattr(stage, 'parallel_inputs') else None,
-          "completed_parallel_inputs": stage.completed_parallel_inputs if hasattr(stage, 'completed_parallel_inputs') else None,
+          "parallel_inputs": parallel_inputs,
+          "completed_parallel_inputs": getattr(
+              stage, 'completed_parallel_inputs', None
+          ),
       }
 
       # Extract step details
@@ -403,46 +793,45 @@ def get_query_execution_plan(job_id: str) -> Dict[str, Any]:
       if stage.steps:
         for step in stage.steps:
           step_info = {
-              "kind": step.kind if hasattr(step, 'kind') else "unknown",
+              "kind": getattr(step, 'kind', "unknown") or "unknown",
           }
-          if hasattr(step, 'substeps') and step.substeps:
-            step_info["substeps"] = [str(sub) for sub in step.substeps]
+          substeps = getattr(step, 'substeps', None)
+          if substeps:
+            step_info["substeps"] = [str(sub) for sub in substeps]
           step_details.append(step_info)
           stage_info["steps_detail"] = step_details
 
       # Check for shuffle operations (potential bottlenecks)
-      if stage_info.get("parallel_inputs", 0) > 10:
+      if (parallel_inputs or 0) > 10:
         bottlenecks.append({
             "stage": stage.name,
             "issue": "High parallel inputs - may cause shuffle overhead",
-            "parallel_inputs": stage_info["parallel_inputs"],
+            "parallel_inputs": parallel_inputs,
         })
 
       # Track shuffle output
-      if hasattr(stage, 'shuffle_output_bytes') and stage.shuffle_output_bytes:
-        shuffle_bytes = stage.shuffle_output_bytes
-        if shuffle_bytes > max_shuffle_output:
-          max_shuffle_output = shuffle_bytes
-          bottlenecks.append({
-              "stage": stage.name,
-              "issue": "Large shuffle output detected",
-              "shuffle_output_bytes": shuffle_bytes,
-          })
+      shuffle_bytes = getattr(stage, 'shuffle_output_bytes', None)
+      if shuffle_bytes and shuffle_bytes > max_shuffle_output:
+        max_shuffle_output = shuffle_bytes
+        bottlenecks.append({
+            "stage": stage.name,
+            "issue": "Large shuffle output detected",
+            "shuffle_output_bytes": shuffle_bytes,
+        })
 
       stages.append(stage_info)
 
     # Calculate total slot time
-    if hasattr(job, 'total_slot_ms'):
-      total_slot_ms = job.total_slot_ms or 0
+    total_slot_ms = getattr(job, 'total_slot_ms', 0) or 0
 
     # Identify optimization opportunities
     optimization_opportunities = []
-    if max_shuffle_output > 10 * (1024 ** 3):  # > 10 GB shuffle
+    if max_shuffle_output > 10 * _BYTES_PER_GB:  # > 10 GB shuffle
       optimization_opportunities.append("Large shuffle detected - consider optimizing JOINs or aggregations")
     if len(stages) > 20:
       optimization_opportunities.append("Many stages detected - query may benefit from simplification")
 
-    return {
+    result = {
         "status": "success",
         "job_id": job_id,
         "execution_plan": {
@@ -453,6 +842,9 @@ def get_query_execution_plan(job_id: str) -> Dict[str, Any]:
         "bottlenecks": bottlenecks if bottlenecks else None,
         "optimization_opportunities": optimization_opportunities if optimization_opportunities else None,
     }
+    if job.state == "DONE":
+      return _cache_job_analysis(cache_key, result)
+    return result
 
   except Exception as e:
     return {
@@ -461,6 +853,35 @@ def get_query_execution_plan(job_id: str) -> Dict[str, Any]:
     }
 
 
+# Dry-run results for the same SQL never change, and agent loops estimate
+# the same query many times while iterating on a fix. Results are memoized
+# on a hash of the normalized text (comments stripped, whitespace
+# collapsed) so reformatted-but-equivalent SQL shares an entry and repeat
+# estimates skip the REST round trip entirely. Bounded FIFO.
+_SQL_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_SQL_WS_RE = re.compile(r"\s+")
+_DRY_RUN_CACHE: Dict[str, int] = {}
+_DRY_RUN_MAX = 1024
+
+
+def _dry_run_total_bytes(client: bigquery.Client, query: str) -> int:
+  """Dry-run a query and return total_bytes_processed, memoized."""
+  normalized = _SQL_WS_RE.sub(" ", _SQL_COMMENT_RE.sub("", query)).strip()
+  key = hashlib.sha256(normalized.encode()).hexdigest()
+
+  cached = _DRY_RUN_CACHE.get(key)
+  if cached is not None:
+    return cached
+
+  job_config = bigquery.QueryJobConfig(dry_run=True, use_query_cache=True)
+  total_bytes = client.query(query, job_config=job_config).total_bytes_processed or 0
+
+  if len(_DRY_RUN_CACHE) >= _DRY_RUN_MAX:
+    _DRY_RUN_CACHE.pop(next(iter(_DRY_RUN_CACHE)))
+  _DRY_RUN_CACHE[key] = total_bytes
+  return total_bytes
+
+
 @agent_tool
 def estimate_query_cost(query: str, dry_run: bool = True) -> Dict[str, Any]:
   """Estimate BigQuery query cost before execution.
@@ -474,25 +895,23 @@ def estimate_query_cost(query: str, dry_run: bool = True) -> Dict[str, Any]:
   """
   client = get_bigquery_client()
   try:
-    # Create a query job config with dry_run enabled
-    job_config = bigquery.QueryJobConfig(dry_run=dry_run, use_query_cache=False)
-
-    # Create the query job
-    query_job = client.query(query, job_config=job_config)
-
-    # Get statistics from dry run
-    total_bytes = query_job.total_bytes_processed or 0
-    total_bytes_tb = total_bytes / (1024 ** 4)
+    if dry_run:
+      total_bytes = _dry_run_total_bytes(client, query)
+    else:
+      job_config = bigquery.QueryJobConfig(use_query_cache=True)
+      query_job = client.query(query, job_config=job_config)
+      total_bytes = query_job.total_bytes_processed or 0
+    total_bytes_tb = total_bytes / _BYTES_PER_TB
 
     # Calculate cost (on-demand pricing: $5 per TB)
     estimated_cost_usd = total_bytes_tb * 5.0
 
     # Generate optimization suggestions
     suggestions = []
-    if total_bytes > 100 * (1024 ** 3):  # > 100 GB
+    if total_bytes > 100 * _BYTES_PER_GB:
       suggestions.append("Large query detected - consider using partitioned/clustered tables")
       suggestions.append("Add WHERE clauses to filter data before processing")
-    if total_bytes > 1000 * (1024 ** 3):  # > 1 TB
+    if total_bytes > 1000 * _BYTES_PER_GB:  # > ~1 TB
       suggestions.append("Very large query - consider incremental processing or data sampling")
     if "SELECT *" in query.upper():
       suggestions.append("Avoid SELECT * - specify only needed columns to reduce bytes scanned")
@@ -524,6 +943,102 @@ def estimate_query_cost(query: str, dry_run: bool = True) -> Dict[str, Any]:
     }
 
 
+# One compiled alternation covers every error-class token; a single
+# finditer pass replaces the dozen independent substring checks (several
+# of which re-ran .lower()) the classifier used per call. slot exhaustion
+# needs two co-occurring tokens, so it is assembled from the slot /
+# slot_limit groups after the scan.
+_ERR_CLASS_RE = re.compile(
+    r"(?P<memory_exhaustion>resources exceeded|memory|100% of limit)"
+    r"|(?P<timeout>timeout|deadline)"
+    r"|(?P<permission_error>access denied|permission)"
+    r"|(?P<table_not_found>not found|does not exist)"
+    r"|(?P<syntax_error>syntax error|invalid)"
+    r"|(?P<slot>slot)"
+    r"|(?P<slot_limit>exceeded|unavailable)",
+    re.IGNORECASE,
+)
+
+# Matches the precedence of the original if/elif chain.
+_ERR_CLASS_PRIORITY = (
+    "memory_exhaustion",
+    "timeout",
+    "permission_error",
+    "table_not_found",
+    "syntax_error",
+    "slot_exhaustion",
+)
+
+# error_type -> (root_cause, suggestion templates). Built once at import so
+# each call does a dict lookup instead of rebuilding the same strings and
+# lists; {location} is the only per-call hole and is filled via .format().
+_ERROR_CLASSES = {
+    "memory_exhaustion": (
+        "Query consumed 100% of available memory. Common causes: large JOINs, complex aggregations, window functions, or processing too much data at once.",
+        (
+            "Break the query into smaller stages (use Dataform incremental tables)",
+            "Add date filters to reduce data volume (e.g., last 3 days instead of full history)",
+            "Optimize JOINs: ensure proper indexes, use smaller tables first",
+            "Consider using incremental processing instead of full refresh",
+            "Review query execution plan to identify memory-intensive operations",
+            "Split complex CTEs into separate materialized tables",
+        ),
+    ),
+    "timeout": (
+        "Query exceeded maximum execution time.",
+        (
+            "Break query into smaller chunks",
+            "Add more aggressive filters to reduce data volume",
+            "Use incremental processing",
+            "Consider using scheduled queries with longer timeout",
+        ),
+    ),
+    "permission_error": (
+        "Insufficient permissions to access resources.",
+        (
+            "Check IAM permissions for the service account",
+            "Verify dataset and table access permissions",
+            "Ensure the service account has BigQuery Data Editor role",
+        ),
+    ),
+    "table_not_found": (
+        "Referenced table or dataset does not exist.",
+        (
+            "Verify table name and dataset are correct",
+            "Check if table exists: SELECT * FROM `project.dataset.table` LIMIT 1",
+            "Ensure table was created before this query runs",
+            "Check for typos in table names",
+        ),
+    ),
+    "syntax_error": (
+        "SQL syntax error in the query.",
+        (
+            "Check SQL syntax at location: {location}",
+            "Review the query for missing commas, parentheses, or quotes",
+            "Validate SQL using BigQuery's query validator",
+        ),
+    ),
+    "slot_exhaustion": (
+        "Insufficient BigQuery slots available.",
+        (
+            "Wait for other queries to complete",
+            "Use reservation with more slots",
+            "Optimize query to use fewer slots",
+            "Schedule query during off-peak hours",
+        ),
+    ),
+    "other_error": (
+        "Unknown error type. Review error message for details.",
+        (
+            "Review the full error message for specific details",
+            "Check BigQuery job logs in Cloud Logging",
+            "Verify query syntax and table references",
+            "Check if related tables have recent data",
+        ),
+    ),
+}
+
+
 @agent_tool
 def analyze_bigquery_error(
     job_id: str,
@@ -541,13 +1056,14 @@ def analyze_bigquery_error(
   Returns:
       Dict[str, Any]: Error analysis including error type, root cause, and suggested fixes.
   """
+  cache_key = ("error", job_id, include_suggestions)
+  cached = _JOB_ANALYSIS_CACHE.get(cache_key)
+  if cached is not None:
+    return cached
+
   client = get_bigquery_client()
   try:
-    # Handle different job_id formats
-    if ':' in job_id and '.' in job_id:
-      job = client.get_job(job_id)
-    else:
-      job = client.get_job(job_id, location=config.location)
+    job = _fetch_job(client, job_id)
 
     if not job.error_result:
       return {
@@ -562,92 +1078,29 @@ def analyze_bigquery_error(
 
     # Extract performance metrics if available
     total_bytes = job.total_bytes_processed or 0
+    total_bytes_tb = total_bytes / _BYTES_PER_TB
     total_slot_ms = job.total_slot_ms or 0
     duration_seconds = None
     if job.started and job.ended:
       duration_seconds = (job.ended - job.started).total_seconds()
 
-    # Classify error type
-    error_type = "unknown"
-    root_cause = None
-    suggestions = []
-
-    # Memory errors
-    if "Resources exceeded" in error_message or "memory" in error_message.lower() or "100% of limit" in error_message:
-      error_type = "memory_exhaustion"
-      root_cause = "Query consumed 100% of available memory. Common causes: large JOINs, complex aggregations, window functions, or processing too much data at once."
-      suggestions = [
-          "Break the query into smaller stages (use Dataform incremental tables)",
-          "Add date filters to reduce data volume (e.g., last 3 days instead of full history)",
-          "Optimize JOINs: ensure proper indexes, use smaller tables first",
-          "Consider using incremental processing instead of full refresh",
-          "Review query execution plan to identify memory-intensive operations",
-          "Split complex CTEs into separate materialized tables",
-      ]
-
-    # Timeout errors
-    elif "timeout" in error_message.lower() or "deadline" in error_message.lower():
-      error_type = "timeout"
-      root_cause = "Query exceeded maximum execution time."
-      suggestions = [
-          "Break query into smaller chunks",
-          "Add more aggressive filters to reduce data volume",
-          "Use incremental processing",
-          "Consider using scheduled queries with longer timeout",
-      ]
-
-    # Permission errors
-    elif "Access Denied" in error_message or "permission" in error_message.lower():
-      error_type = "permission_error"
-      root_cause = "Insufficient permissions to access resources."
-      suggestions = [
-          "Check IAM permissions for the service account",
-          "Verify dataset and table access permissions",
-          "Ensure the service account has BigQuery Data Editor role",
-      ]
-
-    # Table not found
-    elif "Not found" in error_message or "does not exist" in error_message.lower():
-      error_type = "table_not_found"
-      root_cause = "Referenced table or dataset does not exist."
-      suggestions = [
-          "Verify table name and dataset are correct",
-          "Check if table exists: SELECT * FROM `project.dataset.table` LIMIT 1",
-          "Ensure table was created before this query runs",
-          "Check for typos in table names",
-      ]
-
-    # Syntax errors
-    elif "Syntax error" in error_message or "Invalid" in error_message:
-      error_type = "syntax_error"
-      root_cause = "SQL syntax error in the query."
-      suggestions = [
-          f"Check SQL syntax at location: {error_location}",
-          "Review the query for missing commas, parentheses, or quotes",
-          "Validate SQL using BigQuery's query validator",
-      ]
-
-    # Slot exhaustion
-    elif "slot" in error_message.lower() and ("exceeded" in error_message.lower() or "unavailable" in error_message.lower()):
-      error_type = "slot_exhaustion"
-      root_cause = "Insufficient BigQuery slots available."
-      suggestions = [
-          "Wait for other queries to complete",
-          "Use reservation with more slots",
-          "Optimize query to use fewer slots",
-          "Schedule query during off-peak hours",
-      ]
-
-    # Generic error - provide general suggestions
-    else:
-      error_type = "other_error"
-      root_cause = "Unknown error type. Review error message for details."
-      suggestions = [
-          "Review the full error message for specific details",
-          "Check BigQuery job logs in Cloud Logging",
-          "Verify query syntax and table references",
-          "Check if related tables have recent data",
-      ]
+    # Classify in one scan: the compiled alternation finds every class
+    # token in a single pass over the message instead of 10+ independent
+    # substring scans (several re-running .lower() each time), then the
+    # priority order of the old if/elif chain picks the winner.
+    hits = {m.lastgroup for m in _ERR_CLASS_RE.finditer(error_message)}
+    if "slot" in hits and "slot_limit" in hits:
+      hits.add("slot_exhaustion")
+    error_type = "other_error"
+    for name in _ERR_CLASS_PRIORITY:
+      if name in hits:
+        error_type = name
+        break
+
+    root_cause, suggestion_templates = _ERROR_CLASSES[error_type]
+    suggestions = [
+        s.format(location=error_location) for s in suggestion_templates
+    ]
 
     # Get query preview if available
     query_preview = None
@@ -667,7 +1120,7 @@ def analyze_bigquery_error(
         },
         "job_metrics": {
             "total_bytes_processed": total_bytes,
-            "total_bytes_processed_tb": round(total_bytes / (1024 ** 4), 4),
+            "total_bytes_processed_tb": round(total_bytes_tb, 4),
             "total_slot_ms": total_slot_ms,
             "duration_seconds": round(duration_seconds, 2) if duration_seconds else None,
             "job_state": job.state,
@@ -684,6 +1137,8 @@ def analyze_bigquery_error(
           "Monitor the next execution to verify the fix worked",
       ]
 
+    if job.state == "DONE":
+      return _cache_job_analysis(cache_key, result)
     return result
 
   except Exception as e:
@@ -693,6 +1148,54 @@ def analyze_bigquery_error(
     }
 
 
+@agent_tool
+def bulk_analyze_bigquery_job(job_id: str) -> Dict[str, Any]:
+  """Analyze performance, execution plan, and errors of a job in one call.
+
+  Chaining analyze_query_performance, get_query_execution_plan and
+  analyze_bigquery_error costs three separate tool round trips for the same
+  job. This returns all three analyses at once; the underlying job is
+  fetched a single time and shared through the finished-job cache.
+
+  Args:
+      job_id (str): The BigQuery job ID to analyze (format: project:location.job_id or just job_id).
+
+  Returns:
+      Dict[str, Any]: performance, execution_plan and error_analysis sections.
+  """
+  return {
+      "status": "success",
+      "job_id": job_id,
+      "performance": analyze_query_performance(job_id),
+      "execution_plan": get_query_execution_plan(job_id),
+      "error_analysis": analyze_bigquery_error(job_id),
+  }
+
+
+@agent_tool
+def bulk_analyze_bigquery_errors(job_ids: List[str]) -> Dict[str, Any]:
+  """Analyze several failed BigQuery jobs in parallel.
+
+  Each analysis is a latency-bound REST lookup; fanning them out over a
+  thread pool (the shared client is thread-safe) makes total latency
+  roughly the slowest single lookup instead of their sum. Useful on the
+  job list returned by find_failed_bigquery_jobs.
+
+  Args:
+      job_ids (List[str]): The BigQuery job IDs to analyze.
+
+  Returns:
+      Dict[str, Any]: Per-job error analyses, in input order.
+  """
+  if not job_ids:
+    return {"status": "success", "count": 0, "analyses": []}
+
+  with ThreadPoolExecutor(max_workers=min(16, len(job_ids))) as pool:
+    analyses = list(pool.map(analyze_bigquery_error, job_ids))
+
+  return {"status": "success", "count": len(analyses), "analyses": analyses}
+
+
 @agent_tool
 def find_failed_bigquery_jobs(
     table_name: Optional[str] = None,
@@ -715,11 +1218,11 @@ def find_failed_bigquery_jobs(
   """
   client = get_bigquery_client()
   try:
-    from datetime import datetime, timedelta
-
-    time_threshold = datetime.utcnow() - timedelta(days=days)
-
-    # Build query to find failed jobs
+    # Bounding creation_time with a closed interval computed server-side
+    # lets BigQuery prune the view's time partitions instead of scanning
+    # the full job history; the parameterized form also keeps the SQL text
+    # identical across invocations so repeated searches hit the result
+    # cache.
     query = f"""
     SELECT
         job_id,
@@ -738,13 +1241,25 @@ def find_failed_bigquery_jobs(
     FROM `{config.project_id}.region-{config.location}.INFORMATION_SCHEMA.JOBS_BY_PROJECT`
     WHERE state = 'DONE'
       AND error_result IS NOT NULL
-      AND creation_time >= TIMESTAMP('{time_threshold.strftime("%Y-%m-%d %H:%M:%S")}')
+      AND creation_time BETWEEN TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL @days DAY)
+                            AND CURRENT_TIMESTAMP()
     """
 
+    params = [
+        bigquery.ScalarQueryParameter("days", "INT64", days),
+        bigquery.ScalarQueryParameter("limit_rows", "INT64", limit),
+    ]
+
     # Add filters
     conditions = []
     if table_name:
-      conditions.append(f"(destination_table.table_id LIKE '%{table_name}%' OR query LIKE '%{table_name}%')")
+      conditions.append(
+          "(CONTAINS_SUBSTR(destination_table.table_id, @table_name)"
+          " OR CONTAINS_SUBSTR(query, @table_name))"
+      )
+      params.append(
+          bigquery.ScalarQueryParameter("table_name", "STRING", table_name)
+      )
 
     if error_type:
       error_patterns = {
@@ -759,25 +1274,38 @@ def find_failed_bigquery_jobs(
     if conditions:
       query += " AND " + " AND ".join(conditions)
 
-    query += f" ORDER BY creation_time DESC LIMIT {limit}"
+    query += " ORDER BY creation_time DESC LIMIT @limit_rows"
 
-    query_job = client.query(query)
-    results = query_job.result()
+    job_config = bigquery.QueryJobConfig(
+        use_query_cache=True, query_parameters=params
+    )
+    results = _run_query(client, query, job_config=job_config)
+
+    # Columnar materialization for big result sets: to_arrow decodes
+    # whole pages in C (and rides the BigQuery Storage API when that
+    # client is installed) instead of per-row REST JSON decode. Small
+    # limits stay on the plain row iterator - the arrow handoff has
+    # fixed overhead that only pays off past a few dozen rows.
+    if limit > 50:
+      rows = _rows_to_dicts(results)
+    else:
+      rows = [dict(row.items()) for row in results]
 
     failed_jobs = []
-    for row in results:
+    for row in rows:
+      creation_time = row.get("creation_time")
       job_info = {
-          "job_id": row.job_id,
-          "creation_time": row.creation_time.isoformat() if row.creation_time else None,
-          "state": row.state,
-          "job_type": row.job_type,
-          "error_message": row.error_message,
-          "error_reason": row.error_reason,
-          "error_location": row.error_location,
-          "destination_table": f"{row.destination_dataset}.{row.destination_table}" if row.destination_table else None,
-          "duration_minutes": row.duration_minutes,
-          "total_bytes_processed": row.total_bytes_processed,
-          "query_preview": row.query_preview,
+          "job_id": row.get("job_id"),
+          "creation_time": creation_time.isoformat() if creation_time else None,
+          "state": row.get("state"),
+          "job_type": row.get("job_type"),
+          "error_message": row.get("error_message"),
+          "error_reason": row.get("error_reason"),
+          "error_location": row.get("error_location"),
+          "destination_table": f"{row['destination_dataset']}.{row['destination_table']}" if row.get("destination_table") else None,
+          "duration_minutes": row.get("duration_minutes"),
+          "total_bytes_processed": row.get("total_bytes_processed"),
+          "query_preview": row.get("query_preview"),
       }
       failed_jobs.append(job_info)
 
@@ -800,10 +1328,62 @@ def find_failed_bigquery_jobs(
     }
 
 
+# Every marker the optimizer looks for, collected in one compiled-regex
+# pass over the uppercased query instead of one full string scan per
+# substring test.
+_SQL_KEYWORDS = (
+    "SELECT *",
+    "WHERE",
+    "DATE(",
+    "TIMESTAMP(",
+    "OVER (",
+    "ROW_NUMBER()",
+    "RANK()",
+    "GROUP BY",
+)
+# JOIN gets word boundaries in the union so identifiers like JOIN_KEY no
+# longer count as joins (every JOIN variant - INNER/LEFT/CROSS etc. -
+# contains exactly one JOIN token, so counting the token counts joins).
+_SQL_KEYWORD_RE = re.compile(
+    "|".join(map(re.escape, _SQL_KEYWORDS)) + r"|\bJOIN\b"
+)
+
+# Captures exactly the GROUP BY column list (up to the next clause), so
+# the comma count is not polluted by whatever else falls inside a fixed
+# window of the query.
+_GROUP_BY_CLAUSE_RE = re.compile(
+    r"GROUP BY\s+(.*?)(?=\bORDER BY\b|\bLIMIT\b|\bHAVING\b|\Z)", re.DOTALL
+)
+
+# One case-insensitive scan of the error message instead of a substring
+# test plus a full lowercased copy for the second test.
+_MEM_ERR_RE = re.compile(r"Resources exceeded|memory", re.IGNORECASE)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Suggestion:
+  """One optimization finding.
+
+  Slotted records are a fraction of the size of the three-key dicts they
+  replace while findings accumulate; they are widened back to dicts only
+  once, at the response boundary, so the tool contract stays plain JSON.
+  """
+
+  issue: str
+  impact: str
+  suggestion: str
+
+# Agent loops tend to re-analyze the same query text several times per
+# session; memoizing the uppercase copy skips a full-string allocation
+# on each repeat.
+_upper_cached = functools.lru_cache(maxsize=256)(str.upper)
+
+
 @agent_tool
 def suggest_query_optimization(
     query: str,
     error_message: Optional[str] = None,
+    quick: bool = False,
 ) -> Dict[str, Any]:
   """Analyze a BigQuery query and suggest optimizations based on the query structure and optional error context.
 
@@ -812,99 +1392,134 @@ def suggest_query_optimization(
   Args:
       query (str): The SQL query to analyze.
       error_message (Optional[str]): Optional error message from a failed execution to provide context-aware suggestions.
+      quick (bool): If True, skip the dry-run round trip whenever static
+        analysis already found a high-priority issue; byte/cost estimates
+        are then omitted from the response.
 
   Returns:
       Dict[str, Any]: Optimization suggestions categorized by type and priority.
   """
   try:
-    # First, do a dry run to get query metrics
-    client = get_bigquery_client()
-    job_config = bigquery.QueryJobConfig(dry_run=True, use_query_cache=False)
-    query_job = client.query(query, job_config=job_config)
-
-    total_bytes = query_job.total_bytes_processed or 0
-    total_bytes_tb = total_bytes / (1024 ** 4)
+    # Nothing to analyze: skip the uppercase copy, the scans and the dry
+    # run entirely. Empty queries are common on early tool-call errors.
+    if not query or not query.strip():
+      return {
+          "status": "success",
+          "query_analysis": {},
+          "optimization_suggestions": {
+              "high_priority": None,
+              "medium_priority": None,
+              "low_priority": None,
+          },
+          "total_suggestions": 0,
+          "error_context": error_message if error_message else None,
+      }
 
-    # Analyze query structure
-    query_upper = query.upper()
+    # Static (local) analysis runs first so quick mode can return advice
+    # without paying a dry-run round trip.
+    query_upper = _upper_cached(query)
     suggestions = []
     high_priority = []
     medium_priority = []
     low_priority = []
 
-    # Check for common issues
-    if "SELECT *" in query_upper:
-      high_priority.append({
-          "issue": "SELECT * usage",
-          "impact": "High - scans all columns unnecessarily",
-          "suggestion": "Specify only needed columns to reduce bytes scanned",
-      })
+    # One traversal of the query collects every keyword hit (and the
+    # first GROUP BY offset) at once.
+    hits = Counter()
+    group_by_pos = -1
+    for m in _SQL_KEYWORD_RE.finditer(query_upper):
+      keyword = m.group()
+      hits[keyword] += 1
+      if group_by_pos < 0 and keyword == "GROUP BY":
+        group_by_pos = m.start()
 
-    # Check for missing WHERE clauses on large tables
-    if total_bytes_tb > 0.1:  # > 100 GB
-      if "WHERE" not in query_upper or ("WHERE" in query_upper and "DATE(" not in query_upper and "TIMESTAMP(" not in query_upper):
-        high_priority.append({
-            "issue": "Large data scan without date filters",
-            "impact": "High - processing too much data",
-            "suggestion": "Add date filters to limit data volume (e.g., WHERE date >= DATE_SUB(CURRENT_DATE(), INTERVAL 3 DAY))",
-        })
+    # Check for common issues
+    if hits["SELECT *"]:
+      high_priority.append(_Suggestion(
+          issue="SELECT * usage",
+          impact="High - scans all columns unnecessarily",
+          suggestion="Specify only needed columns to reduce bytes scanned",
+      ))
 
     # Check for complex JOINs
-    join_count = query_upper.count("JOIN")
+    join_count = hits["JOIN"]
     if join_count > 5:
-      high_priority.append({
-          "issue": f"Multiple JOINs ({join_count} JOINs detected)",
-          "impact": "High - complex JOINs can cause memory issues",
-          "suggestion": "Consider breaking into multiple stages with materialized intermediate tables",
-      })
+      high_priority.append(_Suggestion(
+          issue=f"Multiple JOINs ({join_count} JOINs detected)",
+          impact="High - complex JOINs can cause memory issues",
+          suggestion="Consider breaking into multiple stages with materialized intermediate tables",
+      ))
 
     # Check for window functions
-    if "OVER (" in query_upper or "ROW_NUMBER()" in query_upper or "RANK()" in query_upper:
-      medium_priority.append({
-          "issue": "Window functions detected",
-          "impact": "Medium - window functions can be memory-intensive",
-          "suggestion": "Ensure window functions are properly partitioned. Consider materializing intermediate results.",
-      })
-
-    # Check for GROUP BY with many columns
-    if "GROUP BY" in query_upper:
-      group_by_match = query_upper.find("GROUP BY")
-      if group_by_match != -1:
-        group_by_section = query_upper[group_by_match:group_by_match + 200]
-        if group_by_section.count(",") > 5:
-          medium_priority.append({
-              "issue": "GROUP BY with many columns",
-              "impact": "Medium - high cardinality can increase memory usage",
-              "suggestion": "Review if all GROUP BY columns are necessary. Consider pre-aggregating some dimensions.",
-          })
+    has_window_functions = bool(
+        hits["OVER ("] or hits["ROW_NUMBER()"] or hits["RANK()"]
+    )
+    if has_window_functions:
+      medium_priority.append(_Suggestion(
+          issue="Window functions detected",
+          impact="Medium - window functions can be memory-intensive",
+          suggestion="Ensure window functions are properly partitioned. Consider materializing intermediate results.",
+      ))
+
+    # Check for GROUP BY with many columns. The clause regex is anchored
+    # at the offset the keyword pass already found, so it never rescans
+    # the query from the start.
+    if group_by_pos >= 0:
+      clause = _GROUP_BY_CLAUSE_RE.match(query_upper, group_by_pos)
+      if clause and clause.group(1).count(",") > 5:
+        medium_priority.append(_Suggestion(
+            issue="GROUP BY with many columns",
+            impact="Medium - high cardinality can increase memory usage",
+            suggestion="Review if all GROUP BY columns are necessary. Consider pre-aggregating some dimensions.",
+        ))
 
     # Error-specific suggestions
     if error_message:
-      if "Resources exceeded" in error_message or "memory" in error_message.lower():
-        high_priority.append({
-            "issue": "Memory error detected",
-            "impact": "Critical - query failed due to memory",
-            "suggestion": "Break query into smaller stages. Use Dataform incremental tables to materialize intermediate results.",
-        })
+      if _MEM_ERR_RE.search(error_message):
+        high_priority.append(_Suggestion(
+            issue="Memory error detected",
+            impact="Critical - query failed due to memory",
+            suggestion="Break query into smaller stages. Use Dataform incremental tables to materialize intermediate results.",
+        ))
+
+    # The dry run only matters for byte-volume checks; skip it when the
+    # caller asked for a quick pass and static analysis is already
+    # actionable. The memo in _dry_run_total_bytes makes repeats free.
+    total_bytes_tb = None
+    if not (quick and high_priority):
+      client = get_bigquery_client()
+      total_bytes = _dry_run_total_bytes(client, query)
+      total_bytes_tb = total_bytes / _BYTES_PER_TB
+
+      # Check for missing WHERE clauses on large tables
+      if total_bytes_tb > 0.1:  # > 100 GB
+        if not hits["WHERE"] or (hits["WHERE"] and not hits["DATE("] and not hits["TIMESTAMP("]):
+          high_priority.append(_Suggestion(
+              issue="Large data scan without date filters",
+              impact="High - processing too much data",
+              suggestion="Add date filters to limit data volume (e.g., WHERE date >= DATE_SUB(CURRENT_DATE(), INTERVAL 3 DAY))",
+          ))
 
     # Build response
-    all_suggestions = high_priority + medium_priority + low_priority
+    total_suggestions = (
+        len(high_priority) + len(medium_priority) + len(low_priority)
+    )
 
     return {
         "status": "success",
         "query_analysis": {
-            "estimated_bytes_tb": round(total_bytes_tb, 4),
-            "estimated_cost_usd": round(total_bytes_tb * 5.0, 4),
+            "estimated_bytes_tb": _r4(total_bytes_tb) if total_bytes_tb is not None else None,
+            "estimated_cost_usd": _r4(total_bytes_tb * 5.0) if total_bytes_tb is not None else None,
             "join_count": join_count,
-            "has_window_functions": "OVER (" in query_upper or "ROW_NUMBER()" in query_upper,
-            "has_group_by": "GROUP BY" in query_upper,
+            "has_window_functions": has_window_functions,
+            "has_group_by": group_by_pos >= 0,
         },
         "optimization_suggestions": {
-            "high_priority": high_priority if high_priority else None,
-            "medium_priority": medium_priority if medium_priority else None,
-            "low_priority": low_priority if low_priority else None,
+            "high_priority": [dataclasses.asdict(s) for s in high_priority] if high_priority else None,
+            "medium_priority": [dataclasses.asdict(s) for s in medium_priority] if medium_priority else None,
+            "low_priority": [dataclasses.asdict(s) for s in low_priority] if low_priority else None,
         },
-        "total_suggestions": len(all_suggestions),
+        "total_suggestions": total_suggestions,
         "error_context": error_message if error_message else None,
     }
 
@@ -940,16 +1555,20 @@ def check_data_freshness(dataset_id: str, table_id: str, freshness_threshold_hou
           "error_message": f"Could not determine last modified time for {dataset_id}.{table_id}",
       }
 
-    # Calculate time since last update
-    now = datetime.utcnow()
-    if isinstance(last_modified, datetime):
-      time_since_update = now - last_modified
-    else:
-      # Handle timestamp format
-      time_since_update = now - last_modified
-
-    hours_since_update = time_since_update.total_seconds() / 3600
-    days_since_update = hours_since_update / 24
+    # Calculate time since last update. table.modified is timezone-aware
+    # (UTC), so compare against an aware "now"; naive datetime.utcnow()
+    # would raise on the subtraction. Raw epoch values (the old
+    # "timestamp format" case) are normalized up front so everything
+    # downstream - the subtraction and isoformat() - is one shape.
+    now = datetime.now(timezone.utc)
+    if not isinstance(last_modified, datetime):
+      last_modified = datetime.fromtimestamp(float(last_modified), tz=timezone.utc)
+    elif last_modified.tzinfo is None:
+      last_modified = last_modified.replace(tzinfo=timezone.utc)
+
+    seconds_since_update = (now - last_modified).total_seconds()
+    hours_since_update = seconds_since_update * _INV_3600
+    days_since_update = hours_since_update * _INV_24
 
     # Determine freshness status
     is_fresh = hours_since_update <= freshness_threshold_hours
@@ -960,8 +1579,8 @@ def check_data_freshness(dataset_id: str, table_id: str, freshness_threshold_hou
     if not is_fresh:
       alerts.append({
           "severity": "warning" if hours_since_update <= freshness_threshold_hours * 2 else "error",
-          "message": f"Data is {round(days_since_update, 1)} days old (threshold: {freshness_threshold_hours} hours)",
-          "hours_over_threshold": round(hours_since_update - freshness_threshold_hours, 1),
+          "message": f"Data is {_r1(days_since_update)} days old (threshold: {freshness_threshold_hours} hours)",
+          "hours_over_threshold": _r1(hours_since_update - freshness_threshold_hours),
       })
 
     return {
@@ -970,9 +1589,9 @@ def check_data_freshness(dataset_id: str, table_id: str, freshness_threshold_hou
         "table": table_id,
         "freshness": {
             "status": status,
-            "last_modified": last_modified.isoformat() if isinstance(last_modified, datetime) else str(last_modified),
-            "hours_since_update": round(hours_since_update, 2),
-            "days_since_update": round(days_since_update, 2),
+            "last_modified": last_modified.isoformat(),
+            "hours_since_update": _r2(hours_since_update),
+            "days_since_update": _r2(days_since_update),
             "threshold_hours": freshness_threshold_hours,
         },
         "alerts": alerts if alerts else None,
@@ -983,3 +1602,80 @@ def check_data_freshness(dataset_id: str, table_id: str, freshness_threshold_hou
         "status": "error",
         "error_message": f"Error checking data freshness: {e}",
     }
+
+
+@agent_tool
+def check_dataset_freshness(dataset_id: str, freshness_threshold_hours: Optional[int] = 24) -> Dict[str, Any]:
+  """Check data freshness for every table in a BigQuery dataset.
+
+  Each table's metadata is an independent REST lookup, so the lookups are
+  fanned out over a thread pool (the shared client is thread-safe) and
+  the whole dataset costs roughly one round trip instead of one per
+  table.
+
+  Args:
+      dataset_id (str): The dataset ID.
+      freshness_threshold_hours (Optional[int]): Expected freshness threshold in hours (default: 24).
+
+  Returns:
+      Dict[str, Any]: Per-table freshness status plus a stale-table count.
+  """
+  client = get_bigquery_client()
+  try:
+    table_refs = [t.reference for t in client.list_tables(dataset_id)]
+    if not table_refs:
+      return {
+          "status": "success",
+          "dataset": dataset_id,
+          "threshold_hours": freshness_threshold_hours,
+          "tables": [],
+          "count": 0,
+          "stale_count": 0,
+      }
+
+    with ThreadPoolExecutor(max_workers=min(16, len(table_refs))) as pool:
+      tables = list(pool.map(client.get_table, table_refs))
+
+    now = datetime.now(timezone.utc)
+    table_results = []
+    stale_count = 0
+    for table in tables:
+      last_modified = table.modified
+      if not last_modified:
+        table_results.append({
+            "table": table.table_id,
+            "status": "unknown",
+            "last_modified": None,
+            "hours_since_update": None,
+        })
+        continue
+
+      if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+
+      hours_since_update = (now - last_modified).total_seconds() * _INV_3600
+      is_fresh = hours_since_update <= freshness_threshold_hours
+      if not is_fresh:
+        stale_count += 1
+
+      table_results.append({
+          "table": table.table_id,
+          "status": "fresh" if is_fresh else "stale",
+          "last_modified": last_modified.isoformat(),
+          "hours_since_update": _r2(hours_since_update),
+      })
+
+    return {
+        "status": "success",
+        "dataset": dataset_id,
+        "threshold_hours": freshness_threshold_hours,
+        "tables": table_results,
+        "count": len(table_results),
+        "stale_count": stale_count,
+    }
+
+  except Exception as e:
+    return {
+        "status": "error",
+        "error_message": f"Error checking dataset freshness: {e}",
+    }
@@ -18,7 +18,13 @@ It includes functionality for cluster management, job submission, notebook execu
 and monitoring. Useful for running PySpark workloads on Databricks.
 """
 
+import dataclasses
+import functools
+import inspect
 import logging
+import operator
+from itertools import islice
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 
 from google.adk.tools import agent_tool
@@ -26,12 +32,28 @@ from google.adk.tools import agent_tool
 import sys
 import os
 
-# Add parent directory to path to import config
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import config
-
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=1)
+def _get_config():
+    """Resolve the project config on first use.
+
+    The eager ``sys.path.insert`` + ``from config import config`` pattern
+    paid a path walk and config-module initialization at import time even
+    if no Databricks tool ever ran. The relative import covers the
+    packaged layout; the path-injection fallback keeps direct module use
+    working.
+    """
+    try:
+        from ..config import config
+    except ImportError:
+        sys.path.insert(
+            0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+        from config import config
+    return config
+
 # Try to import Databricks SDK
 try:
     from databricks.sdk import WorkspaceClient
@@ -46,15 +68,34 @@ try:
         PythonWheelTask,
         SparkPythonTask,
         Task,
+        TaskDependency,
     )
     DATABRICKS_AVAILABLE = True
+    # ListClustersFilterBy landed in a later SDK release than the rest of
+    # these imports; fall back to client-side filtering when it is absent.
+    try:
+        from databricks.sdk.service.compute import ListClustersFilterBy, State
+    except ImportError:
+        ListClustersFilterBy = None
 except ImportError:
     DATABRICKS_AVAILABLE = False
+    ListClustersFilterBy = None
     logger.warning(
         "Databricks SDK not installed. Install with: pip install databricks-sdk"
     )
 
 
+@functools.lru_cache(maxsize=4)
+def _build_client(host: str, token: str) -> Any:
+    """Construct a WorkspaceClient once per (host, token) pair.
+
+    WorkspaceClient setup (TLS session, auth probing) is expensive enough
+    to dominate back-to-back tool calls; caching it also reuses the
+    underlying requests.Session connection pool across API calls.
+    """
+    return WorkspaceClient(host=host, token=token)
+
+
 def _get_databricks_client() -> Optional[Any]:
     """Get Databricks WorkspaceClient instance.
 
@@ -63,6 +104,7 @@ def _get_databricks_client() -> Optional[Any]:
     if not DATABRICKS_AVAILABLE:
         return None
 
+    config = _get_config()
     databricks_host = config.databricks_host or os.getenv("DATABRICKS_HOST")
     databricks_token = config.databricks_token or os.getenv("DATABRICKS_TOKEN")
 
@@ -73,20 +115,130 @@ def _get_databricks_client() -> Optional[Any]:
         return None
 
     try:
-        return WorkspaceClient(
-            host=databricks_host,
-            token=databricks_token,
-        )
+        return _build_client(databricks_host, databricks_token)
     except Exception as e:
         logger.error(f"Error creating Databricks client: {e}", exc_info=True)
         return None
 
 
+# Shared, immutable error payloads: built once at import instead of as a
+# fresh dict literal inside every tool. Returned as dict copies so callers
+# keep getting plain (JSON-serializable, mutable) dicts.
+_ERR_SDK_MISSING = MappingProxyType({
+    "status": "error",
+    "error_message": "Databricks SDK not installed. Install with: pip install databricks-sdk",
+})
+_ERR_NO_CLIENT = MappingProxyType({
+    "status": "error",
+    "error_message": "Databricks client not available. Configure DATABRICKS_HOST and DATABRICKS_TOKEN.",
+})
+
+try:
+    import orjson
+except ImportError:  # optional; plain dict copies are the fallback
+    orjson = None
+
+if orjson is not None:
+    # Rehydrating a small fixed payload from prerendered bytes via
+    # orjson's C decoder is faster than building the dict copy in Python.
+    _ERR_SDK_JSON = orjson.dumps(dict(_ERR_SDK_MISSING))
+    _ERR_NO_CLIENT_JSON = orjson.dumps(dict(_ERR_NO_CLIENT))
+
+    def _err_sdk_missing() -> Dict[str, Any]:
+        return orjson.loads(_ERR_SDK_JSON)
+
+    def _err_no_client() -> Dict[str, Any]:
+        return orjson.loads(_ERR_NO_CLIENT_JSON)
+else:
+    def _err_sdk_missing() -> Dict[str, Any]:
+        return dict(_ERR_SDK_MISSING)
+
+    def _err_no_client() -> Dict[str, Any]:
+        return dict(_ERR_NO_CLIENT)
+
+
+def require_databricks(fn):
+    """Handle the SDK-availability and credential preamble in one place.
+
+    Every Databricks tool started with the same ten lines checking
+    DATABRICKS_AVAILABLE and constructing a client. Wrapped functions
+    receive the WorkspaceClient as their first argument and can assume it
+    is usable.
+    """
+    sig = inspect.signature(fn)
+    public = [p for name, p in sig.parameters.items() if name != "client"]
+
+    @functools.wraps(fn)
+    def wrap(*args, **kwargs):
+        if not DATABRICKS_AVAILABLE:
+            return _err_sdk_missing()
+        client = _get_databricks_client()
+        if not client:
+            return _err_no_client()
+        return fn(client, *args, **kwargs)
+
+    # agent_tool builds its schema from the visible signature; hide the
+    # injected client parameter from it.
+    wrap.__signature__ = sig.replace(parameters=public)
+    return wrap
+
+
+# Bulk field extraction for the listing loops: one C-level attrgetter
+# call per item instead of several LOAD_ATTR dispatches.
+_CLUSTER_FIELDS = operator.attrgetter(
+    "cluster_id", "cluster_name", "state", "num_workers", "spark_version"
+)
+_JOB_FIELDS = operator.attrgetter("job_id", "settings", "created_time")
+_RUN_FIELDS = operator.attrgetter("run_id", "job_id", "state", "start_time")
+
+# Hard ceiling on unbounded listings: islice stops pulling from the SDK
+# pager once the cap is reached, so later pages are never fetched or
+# deserialized.
+_MAX_CLUSTERS = 1000
+
+# Response-dict keys shared by every tool call: interning them once lets
+# dict construction hash by pointer identity instead of recomputing each
+# string hash per item. CPython interns identifier-looking literals on
+# its own, but doing it explicitly guarantees it across versions.
+for _key in (
+    "status", "error_message", "message", "note",
+    "cluster_id", "cluster_name", "state", "num_workers", "spark_version",
+    "job_id", "job_name", "run_id", "result_state", "state_message",
+    "start_time", "end_time", "created_time",
+):
+    sys.intern(_key)
+del _key
+
+
+if DATABRICKS_AVAILABLE:
+    # Prebuilt submission templates: dataclasses.replace copies a template
+    # and overrides only the fields that differ, instead of walking the
+    # SDK dataclasses' full __init__ chains on every submission. Every
+    # mutable field is overridden per call, so the shared defaults are
+    # never aliased.
+    _SPARK_TASK_TEMPLATE = SparkPythonTask(python_file="", parameters=[])
+    _NOTEBOOK_TASK_TEMPLATE = NotebookTask(notebook_path="", base_parameters={})
+    _PY_TASK_TEMPLATE = Task(
+        task_key="main_task",
+        spark_python_task=_SPARK_TASK_TEMPLATE,
+        existing_cluster_id="",
+        libraries=[],
+    )
+    _NB_TASK_TEMPLATE = Task(
+        task_key="notebook_task",
+        notebook_task=_NOTEBOOK_TASK_TEMPLATE,
+        existing_cluster_id="",
+    )
+    _JOB_SETTINGS_TEMPLATE = JobSettings(name="", tasks=[])
+
+
 # ==================== CLUSTER MANAGEMENT ====================
 
 
 @agent_tool
+@require_databricks
 def create_databricks_cluster(
+    client: Any,
     cluster_name: str,
     num_workers: int = 2,
     node_type_id: str = "i3.xlarge",
@@ -107,19 +259,6 @@ def create_databricks_cluster(
     Returns:
         Dict with cluster creation status and cluster ID.
     """
-    if not DATABRICKS_AVAILABLE:
-        return {
-            "status": "error",
-            "error_message": "Databricks SDK not installed. Install with: pip install databricks-sdk",
-        }
-
-    client = _get_databricks_client()
-    if not client:
-        return {
-            "status": "error",
-            "error_message": "Databricks client not available. Configure DATABRICKS_HOST and DATABRICKS_TOKEN.",
-        }
-
     try:
         cluster_spec = ClusterSpec(
             cluster_name=cluster_name,
@@ -151,7 +290,9 @@ def create_databricks_cluster(
 
 
 @agent_tool
+@require_databricks
 def list_databricks_clusters(
+    client: Any,
     include_terminated: bool = False,
 ) -> Dict[str, Any]:
     """List all Databricks clusters.
@@ -162,35 +303,36 @@ def list_databricks_clusters(
     Returns:
         Dict with list of clusters and their status.
     """
-    if not DATABRICKS_AVAILABLE:
-        return {
-            "status": "error",
-            "error_message": "Databricks SDK not installed. Install with: pip install databricks-sdk",
-        }
-
-    client = _get_databricks_client()
-    if not client:
-        return {
-            "status": "error",
-            "error_message": "Databricks client not available. Configure DATABRICKS_HOST and DATABRICKS_TOKEN.",
-        }
-
     try:
-        clusters = client.clusters.list()
-
-        cluster_list = []
-        for cluster in clusters:
-            if not include_terminated and cluster.state and cluster.state.value == "TERMINATED":
-                continue
-
-            cluster_info = {
-                "cluster_id": cluster.cluster_id,
-                "cluster_name": cluster.cluster_name,
-                "state": cluster.state.value if cluster.state else "UNKNOWN",
-                "num_workers": cluster.num_workers,
-                "spark_version": cluster.spark_version,
-            }
-            cluster_list.append(cluster_info)
+        # Predicate pushdown: ask the workspace for non-terminated states
+        # instead of fetching everything and discarding TERMINATED rows
+        # here - in busy workspaces terminated clusters dominate the
+        # listing. The comprehension filter below stays as the fallback
+        # for SDKs without ListClustersFilterBy.
+        if not include_terminated and ListClustersFilterBy is not None:
+            clusters = client.clusters.list(
+                filter_by=ListClustersFilterBy(
+                    cluster_states=[s for s in State if s is not State.TERMINATED]
+                )
+            )
+        else:
+            clusters = client.clusters.list()
+
+        cluster_list = list(islice(
+            (
+                {
+                    "cluster_id": cluster_id,
+                    "cluster_name": cluster_name,
+                    "state": state.value if state else "UNKNOWN",
+                    "num_workers": num_workers,
+                    "spark_version": spark_version,
+                }
+                for cluster_id, cluster_name, state, num_workers, spark_version
+                in map(_CLUSTER_FIELDS, clusters)
+                if include_terminated or not (state and state.value == "TERMINATED")
+            ),
+            _MAX_CLUSTERS,
+        ))
 
         return {
             "status": "success",
@@ -207,7 +349,9 @@ def list_databricks_clusters(
 
 
 @agent_tool
+@require_databricks
 def get_databricks_cluster_status(
+    client: Any,
     cluster_id: str,
 ) -> Dict[str, Any]:
     """Get status and details of a Databricks cluster.
@@ -218,19 +362,6 @@ def get_databricks_cluster_status(
     Returns:
         Dict with cluster status and details.
     """
-    if not DATABRICKS_AVAILABLE:
-        return {
-            "status": "error",
-            "error_message": "Databricks SDK not installed. Install with: pip install databricks-sdk",
-        }
-
-    client = _get_databricks_client()
-    if not client:
-        return {
-            "status": "error",
-            "error_message": "Databricks client not available. Configure DATABRICKS_HOST and DATABRICKS_TOKEN.",
-        }
-
     try:
         cluster = client.clusters.get(cluster_id)
 
@@ -256,7 +387,9 @@ def get_databricks_cluster_status(
 
 
 @agent_tool
+@require_databricks
 def delete_databricks_cluster(
+    client: Any,
     cluster_id: str,
 ) -> Dict[str, Any]:
     """Delete a Databricks cluster.
@@ -267,19 +400,6 @@ def delete_databricks_cluster(
     Returns:
         Dict with deletion status.
     """
-    if not DATABRICKS_AVAILABLE:
-        return {
-            "status": "error",
-            "error_message": "Databricks SDK not installed. Install with: pip install databricks-sdk",
-        }
-
-    client = _get_databricks_client()
-    if not client:
-        return {
-            "status": "error",
-            "error_message": "Databricks client not available. Configure DATABRICKS_HOST and DATABRICKS_TOKEN.",
-        }
-
     try:
         client.clusters.delete(cluster_id)
 
@@ -301,7 +421,9 @@ def delete_databricks_cluster(
 
 
 @agent_tool
+@require_databricks
 def submit_databricks_pyspark_job(
+    client: Any,
     job_name: str,
     python_file: str,
     cluster_id: Optional[str] = None,
@@ -323,19 +445,6 @@ def submit_databricks_pyspark_job(
     Returns:
         Dict with job submission status and job ID.
     """
-    if not DATABRICKS_AVAILABLE:
-        return {
-            "status": "error",
-            "error_message": "Databricks SDK not installed. Install with: pip install databricks-sdk",
-        }
-
-    client = _get_databricks_client()
-    if not client:
-        return {
-            "status": "error",
-            "error_message": "Databricks client not available. Configure DATABRICKS_HOST and DATABRICKS_TOKEN.",
-        }
-
     try:
         # Use existing_cluster_id if provided, otherwise use cluster_id
         target_cluster_id = existing_cluster_id or cluster_id
@@ -347,9 +456,10 @@ def submit_databricks_pyspark_job(
             }
 
         # Create Spark Python task
-        task = Task(
-            task_key="main_task",
-            spark_python_task=SparkPythonTask(
+        task = dataclasses.replace(
+            _PY_TASK_TEMPLATE,
+            spark_python_task=dataclasses.replace(
+                _SPARK_TASK_TEMPLATE,
                 python_file=python_file,
                 parameters=parameters or [],
             ),
@@ -358,9 +468,8 @@ def submit_databricks_pyspark_job(
         )
 
         # Create job settings
-        job_settings = JobSettings(
-            name=job_name,
-            tasks=[task],
+        job_settings = dataclasses.replace(
+            _JOB_SETTINGS_TEMPLATE, name=job_name, tasks=[task]
         )
 
         # Create job
@@ -387,7 +496,9 @@ def submit_databricks_pyspark_job(
 
 
 @agent_tool
+@require_databricks
 def submit_databricks_notebook_job(
+    client: Any,
     job_name: str,
     notebook_path: str,
     cluster_id: Optional[str] = None,
@@ -406,19 +517,6 @@ def submit_databricks_notebook_job(
     Returns:
         Dict with job submission status and job ID.
     """
-    if not DATABRICKS_AVAILABLE:
-        return {
-            "status": "error",
-            "error_message": "Databricks SDK not installed. Install with: pip install databricks-sdk",
-        }
-
-    client = _get_databricks_client()
-    if not client:
-        return {
-            "status": "error",
-            "error_message": "Databricks client not available. Configure DATABRICKS_HOST and DATABRICKS_TOKEN.",
-        }
-
     try:
         target_cluster_id = existing_cluster_id or cluster_id
 
@@ -429,9 +527,10 @@ def submit_databricks_notebook_job(
             }
 
         # Create notebook task
-        task = Task(
-            task_key="notebook_task",
-            notebook_task=NotebookTask(
+        task = dataclasses.replace(
+            _NB_TASK_TEMPLATE,
+            notebook_task=dataclasses.replace(
+                _NOTEBOOK_TASK_TEMPLATE,
                 notebook_path=notebook_path,
                 base_parameters=base_parameters or {},
             ),
@@ -439,9 +538,8 @@ def submit_databricks_notebook_job(
         )
 
         # Create job settings
-        job_settings = JobSettings(
-            name=job_name,
-            tasks=[task],
+        job_settings = dataclasses.replace(
+            _JOB_SETTINGS_TEMPLATE, name=job_name, tasks=[task]
         )
 
         # Create job
@@ -468,30 +566,108 @@ def submit_databricks_notebook_job(
 
 
 @agent_tool
-def check_databricks_job_status(
-    run_id: str,
+@require_databricks
+def submit_databricks_batch(
+    client: Any,
+    job_name: str,
+    tasks: List[Dict[str, Any]],
+    cluster_id: str,
 ) -> Dict[str, Any]:
-    """Check the status of a Databricks job run.
+    """Submit several related tasks as one multi-task Databricks job.
+
+    Submitting N tasks through the single-task tools costs two REST round
+    trips each (jobs.create + run_now); packing them into one
+    JobSettings(tasks=[...]) cuts that to two calls total and lets
+    Databricks schedule the dependency graph itself.
 
     Args:
-        run_id: ID of the job run to check.
+        job_name: Name for the job.
+        tasks: Task specs. Each entry needs either 'python_file' or
+               'notebook_path', plus optional 'task_key', 'parameters'
+               (list, for Python files), 'base_parameters' (dict, for
+               notebooks), 'libraries', and 'depends_on' (list of task
+               keys that must finish first).
+        cluster_id: ID of the existing cluster all tasks run on.
 
     Returns:
-        Dict with job run status and details.
+        Dict with job submission status, job ID, run ID and task keys.
     """
-    if not DATABRICKS_AVAILABLE:
+    try:
+        if not tasks:
+            return {
+                "status": "error",
+                "error_message": "tasks must contain at least one task spec",
+            }
+
+        task_objs = []
+        for i, spec in enumerate(tasks):
+            task_key = spec.get("task_key") or f"task_{i}"
+            depends_on = [
+                TaskDependency(task_key=dep)
+                for dep in spec.get("depends_on") or []
+            ] or None
+
+            if spec.get("python_file"):
+                task_objs.append(Task(
+                    task_key=task_key,
+                    spark_python_task=SparkPythonTask(
+                        python_file=spec["python_file"],
+                        parameters=spec.get("parameters") or [],
+                    ),
+                    existing_cluster_id=cluster_id,
+                    libraries=spec.get("libraries") or [],
+                    depends_on=depends_on,
+                ))
+            elif spec.get("notebook_path"):
+                task_objs.append(Task(
+                    task_key=task_key,
+                    notebook_task=NotebookTask(
+                        notebook_path=spec["notebook_path"],
+                        base_parameters=spec.get("base_parameters") or {},
+                    ),
+                    existing_cluster_id=cluster_id,
+                    depends_on=depends_on,
+                ))
+            else:
+                return {
+                    "status": "error",
+                    "error_message": f"Task {i} needs either 'python_file' or 'notebook_path'",
+                }
+
+        job = client.jobs.create(JobSettings(name=job_name, tasks=task_objs))
+        run = client.jobs.run_now(job.job_id)
+
         return {
-            "status": "error",
-            "error_message": "Databricks SDK not installed. Install with: pip install databricks-sdk",
+            "status": "success",
+            "message": f"Batch job '{job_name}' submitted with {len(task_objs)} tasks",
+            "job_id": job.job_id,
+            "run_id": run.run_id,
+            "cluster_id": cluster_id,
+            "task_keys": [t.task_key for t in task_objs],
         }
 
-    client = _get_databricks_client()
-    if not client:
+    except Exception as e:
+        logger.error(f"Error submitting Databricks batch job: {e}", exc_info=True)
         return {
             "status": "error",
-            "error_message": "Databricks client not available. Configure DATABRICKS_HOST and DATABRICKS_TOKEN.",
+            "error_message": f"Failed to submit batch job: {str(e)}",
         }
 
+
+@agent_tool
+@require_databricks
+def check_databricks_job_status(
+    client: Any,
+    run_id: str,
+) -> Dict[str, Any]:
+    """Check the status of a Databricks job run.
+
+    Args:
+        run_id: ID of the job run to check.
+
+    Returns:
+        Dict with job run status and details.
+    """
     try:
         run = client.jobs.get_run(run_id)
 
@@ -518,7 +694,9 @@ def check_databricks_job_status(
 
 
 @agent_tool
+@require_databricks
 def list_databricks_jobs(
+    client: Any,
     limit: int = 20,
 ) -> Dict[str, Any]:
     """List Databricks jobs.
@@ -529,30 +707,20 @@ def list_databricks_jobs(
     Returns:
         Dict with list of jobs.
     """
-    if not DATABRICKS_AVAILABLE:
-        return {
-            "status": "error",
-            "error_message": "Databricks SDK not installed. Install with: pip install databricks-sdk",
-        }
-
-    client = _get_databricks_client()
-    if not client:
-        return {
-            "status": "error",
-            "error_message": "Databricks client not available. Configure DATABRICKS_HOST and DATABRICKS_TOKEN.",
-        }
-
     try:
         jobs = client.jobs.list(limit=limit)
 
-        job_list = []
-        for job in jobs:
-            job_info = {
-                "job_id": job.job_id,
-                "job_name": job.settings.name if job.settings else "Unknown",
-                "created_time": job.created_time.isoformat() if job.created_time else None,
-            }
-            job_list.append(job_info)
+        job_list = list(islice(
+            (
+                {
+                    "job_id": job_id,
+                    "job_name": settings.name if settings else "Unknown",
+                    "created_time": created_time.isoformat() if created_time else None,
+                }
+                for job_id, settings, created_time in map(_JOB_FIELDS, jobs)
+            ),
+            limit,
+        ))
 
         return {
             "status": "success",
@@ -569,7 +737,9 @@ def list_databricks_jobs(
 
 
 @agent_tool
+@require_databricks
 def get_databricks_job_runs(
+    client: Any,
     job_id: Optional[str] = None,
     limit: int = 20,
 ) -> Dict[str, Any]:
@@ -582,35 +752,25 @@ def get_databricks_job_runs(
     Returns:
         Dict with list of job runs.
     """
-    if not DATABRICKS_AVAILABLE:
-        return {
-            "status": "error",
-            "error_message": "Databricks SDK not installed. Install with: pip install databricks-sdk",
-        }
-
-    client = _get_databricks_client()
-    if not client:
-        return {
-            "status": "error",
-            "error_message": "Databricks client not available. Configure DATABRICKS_HOST and DATABRICKS_TOKEN.",
-        }
-
     try:
         if job_id:
             runs = client.jobs.list_runs(job_id=job_id, limit=limit)
         else:
             runs = client.jobs.list_runs(limit=limit)
 
-        run_list = []
-        for run in runs:
-            run_info = {
-                "run_id": run.run_id,
-                "job_id": run.job_id,
-                "state": run.state.life_cycle_state.value if run.state else "UNKNOWN",
-                "result_state": run.state.result_state.value if run.state and run.state.result_state else None,
-                "start_time": run.start_time.isoformat() if run.start_time else None,
-            }
-            run_list.append(run_info)
+        run_list = list(islice(
+            (
+                {
+                    "run_id": run_id,
+                    "job_id": run_job_id,
+                    "state": state.life_cycle_state.value if state else "UNKNOWN",
+                    "result_state": state.result_state.value if state and state.result_state else None,
+                    "start_time": start_time.isoformat() if start_time else None,
+                }
+                for run_id, run_job_id, state, start_time in map(_RUN_FIELDS, runs)
+            ),
+            limit,
+        ))
 
         return {
             "status": "success",
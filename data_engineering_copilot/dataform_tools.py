@@ -32,6 +32,8 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import config
 
+from ._tool_cache import cached_read_tool, invalidate_group
+
 DATAFORM_CLIENT = dataform_v1.DataformClient()
 
 def get_workspace_path() -> str:
@@ -43,6 +45,21 @@ def get_workspace_path() -> str:
       config.workspace_name,
   )
 
+# Compilation is a pure function of the workspace contents, so compile-only
+# results are memoized against a version counter that every workspace
+# mutation bumps. Agent "compile, fix, compile" loops then skip the remote
+# compilation entirely when nothing changed between calls.
+_workspace_version = 0
+_compile_cache: Dict[int, Dict[str, Any]] = {}
+
+
+def _bump_workspace_version() -> None:
+  """Invalidate memoized results after a workspace mutation."""
+  global _workspace_version
+  _workspace_version += 1
+  _compile_cache.clear()
+  invalidate_group("dataform_reads")
+
 @agent_tool
 def write_file_to_dataform(file_content: str, file_path: str) -> str:
   """Upload a file to Dataform.
@@ -63,6 +80,7 @@ def write_file_to_dataform(file_content: str, file_path: str) -> str:
         contents=file_content.encode("utf-8"),
     )
     DATAFORM_CLIENT.write_file(request=request)
+    _bump_workspace_version()
     print(f"File Uploaded: {file_path}")
     return f"File Uploaded: {file_path}"
   except GoogleAPIError as e:
@@ -88,6 +106,7 @@ def delete_file_from_dataform(file_path: str) -> str:
   )
   try:
     DATAFORM_CLIENT.remove_file(request=request)
+    _bump_workspace_version()
     print(f"File Deleted: {file_path}")
     return f"File Deleted: {file_path}"
   except GoogleAPIError as e:
@@ -107,6 +126,11 @@ def compile_dataform(compile_only: bool = False) -> Dict[str, Any]:
       Dict[str, Any]: Compilation results including status and pipeline DAG.
   """
   try:
+    if compile_only:
+      cached = _compile_cache.get(_workspace_version)
+      if cached is not None:
+        return cached
+
     repository_path = DATAFORM_CLIENT.repository_path(
         config.project_id, config.location, config.repository_name
     )
@@ -141,11 +165,13 @@ def compile_dataform(compile_only: bool = False) -> Dict[str, Any]:
     ).compilation_result_actions
 
     if compile_only:
-      return {
+      result = {
           "status": "success",
           "message": "Compilation successful (compile-only mode)",
           "pipeline_dag": str(actions),
       }
+      _compile_cache[_workspace_version] = result
+      return result
 
     # Execute the workflow if not in compile-only mode
     workflow_invocation = dataform_v1.WorkflowInvocation()
@@ -172,6 +198,7 @@ def compile_dataform(compile_only: bool = False) -> Dict[str, Any]:
     return {"status": "error", "error_message": error_msg}
 
 @agent_tool
+@cached_read_tool(group="dataform_reads")
 def read_file_from_dataform(file_path: str) -> str:
   """Read a file from Dataform.
 
@@ -197,6 +224,7 @@ def read_file_from_dataform(file_path: str) -> str:
     return error_msg
 
 @agent_tool
+@cached_read_tool(group="dataform_reads")
 def search_files_in_dataform(pattern: Optional[str] = None) -> List[str]:
   """Search for files in Dataform.
 
@@ -481,6 +509,7 @@ def _get_available_tags(actions: List[Any]) -> List[str]:
 
 
 @agent_tool
+@cached_read_tool(group="dataform_reads")
 def read_workflow_settings() -> str:
   """Read the workflow_settings.yaml file from Dataform.
 
@@ -527,6 +556,7 @@ def get_workflow_status(workflow_invocation_id: str) -> Dict[str, Any]:
 
 
 @agent_tool
+@cached_read_tool(group="dataform_reads")
 def get_dataform_repo_link() -> Dict[str, str]:
   """Generate the GCP console link for the Dataform repository.
 
@@ -18,24 +18,315 @@ It includes functionality for running dbt commands, testing, compiling, generati
 managing seeds and snapshots, and various other dbt operations commonly used by data engineers.
 """
 
+import contextlib
+import functools
+import inspect
+import io
 import json
 import logging
+import os
+import selectors
+import shlex
 import subprocess
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
 
 from google.adk.tools import agent_tool
 
 logger = logging.getLogger(__name__)
 
+# dbt's programmatic entry point. Invoking in process skips the Python
+# interpreter startup, module imports and adapter registration that a
+# fresh `dbt` subprocess pays on every call (seconds per invocation for
+# short commands like ls/parse). The CLI subprocess stays available as a
+# fallback for environments where only the executable is installed.
+try:
+    from dbt.cli.main import dbtRunner
+    DBT_RUNNER_AVAILABLE = True
+except ImportError:
+    dbtRunner = None
+    DBT_RUNNER_AVAILABLE = False
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is the fallback
+    orjson = None
+
+
+# Upper bound on retained log lines per stream for the subprocess path;
+# a dbt run over a large DAG can emit tens of MB otherwise.
+_MAX_LOG_LINES = 10_000
+
+# Global flags that skip work read-mostly commands never need: relation
+# cache population, run_results.json writes and usage telemetry. They go
+# in front of the subcommand, where dbt expects global flags.
+_LIGHTWEIGHT_FLAGS = (
+    "--no-populate-cache",
+    "--no-write-json",
+    "--no-send-anonymous-usage-stats",
+)
+
+# dbt-core does not support concurrent programmatic invocations in one
+# process: the runner mutates global flags and the event manager, and the
+# pooled adapter is shared. At most one in-process invocation may be in
+# flight; concurrent callers take the subprocess path instead.
+_INPROCESS_LOCK = threading.Lock()
+
+_ADAPTER_POOL_ENABLED = False
+
+
+def _enable_adapter_pool() -> None:
+    """Keep the warehouse adapter and its connections alive between runs.
+
+    dbt tears the adapter down when each command exits, so run -> test
+    sequences pay a fresh warehouse connect each time. This patches the
+    adapter_management context to a no-op and disables per-command
+    cleanup_connections; the real teardown is deferred to interpreter
+    exit. Applied lazily on the first pooled invocation and skipped
+    wholesale if dbt's internals don't match.
+    """
+    global _ADAPTER_POOL_ENABLED
+    if _ADAPTER_POOL_ENABLED:
+        return
+    try:
+        import atexit
+        from dbt.adapters import factory as _factory
+        from dbt.adapters.base import BaseAdapter
+
+        original_cleanup = BaseAdapter.cleanup_connections
+
+        @contextlib.contextmanager
+        def _pooled_adapter_management():
+            yield
+
+        def _close_pooled_adapters():
+            BaseAdapter.cleanup_connections = original_cleanup
+            _factory.reset_adapters()
+
+        _factory.adapter_management = _pooled_adapter_management
+        # The CLI layer binds adapter_management by name at import; patch
+        # that reference too where it exists.
+        try:
+            from dbt.cli import requires as _requires
+            _requires.adapter_management = _pooled_adapter_management
+        except (ImportError, AttributeError):
+            pass
+        BaseAdapter.cleanup_connections = lambda self: None
+        atexit.register(_close_pooled_adapters)
+        _ADAPTER_POOL_ENABLED = True
+    except Exception as e:
+        logger.warning(f"Could not enable dbt adapter pooling: {e}")
+
+
+# One warmed runner per project: the first call pays the full parse and
+# the manifest it produces is fed back into dbtRunner(manifest=...), so
+# later invocations skip re-parsing the project (the dominant cost for
+# short commands on large DAGs). Entries are invalidated when the
+# project's source trees change on disk.
+_RUNNERS: Dict[tuple, tuple] = {}
+
+
+def _project_fingerprint(project_dir: str) -> tuple:
+    """Newest mtime and file count across the project's source trees."""
+    newest = 0.0
+    count = 0
+    for root in ("models", "seeds", "snapshots", "macros", "tests"):
+        for dirpath, _, filenames in os.walk(os.path.join(project_dir, root)):
+            for name in filenames:
+                try:
+                    stat = os.stat(os.path.join(dirpath, name))
+                except OSError:
+                    continue
+                if stat.st_mtime > newest:
+                    newest = stat.st_mtime
+                count += 1
+    for name in ("dbt_project.yml", "packages.yml"):
+        try:
+            stat = os.stat(os.path.join(project_dir, name))
+        except OSError:
+            continue
+        if stat.st_mtime > newest:
+            newest = stat.st_mtime
+        count += 1
+    return (newest, count)
+
+
+def _get_runner(project_dir: str, profiles_dir: str) -> Any:
+    """Return a manifest-preloaded runner for the project, warming it once."""
+    key = (project_dir, profiles_dir)
+    fingerprint = _project_fingerprint(project_dir)
+    cached = _RUNNERS.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    runner = dbtRunner()
+    res = runner.invoke(
+        ["parse", "--project-dir", project_dir, "--profiles-dir", profiles_dir]
+    )
+    if res.success and res.result is not None:
+        runner = dbtRunner(manifest=res.result)
+    _RUNNERS[key] = (fingerprint, runner)
+    return runner
+
+
+# Memoized results for read-only commands (ls, compile, parse). A chatty
+# agent session repeats these with identical arguments many times between
+# file edits; the project fingerprint is part of the cache key, so any
+# change under the source trees invalidates stale entries automatically.
+# Write commands (run, seed, build...) are never cached.
+_RESULT_CACHE: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_RESULT_CACHE_MAX = 64
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts/lists into hashable tuples for cache keys."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _mtime_cached(fn):
+    """Memoize a read-only tool on its arguments plus the project state."""
+
+    @functools.wraps(fn)
+    def wrap(project_dir: str, *args, **kwargs):
+        key = (
+            fn.__name__,
+            project_dir,
+            _freeze(args),
+            _freeze(kwargs),
+            _project_fingerprint(project_dir),
+        )
+        hit = _RESULT_CACHE.get(key)
+        if hit is not None:
+            _RESULT_CACHE.move_to_end(key)
+            return dict(hit)
+        result = fn(project_dir, *args, **kwargs)
+        if result.get("status") == "success":
+            _RESULT_CACHE[key] = result
+            if len(_RESULT_CACHE) > _RESULT_CACHE_MAX:
+                _RESULT_CACHE.popitem(last=False)
+        return result
+
+    return wrap
+
+
+def _ttl_cached(ttl_seconds: float, key_files: tuple = ()):
+    """Memoize a tool on its arguments for a fixed time window.
+
+    For commands whose result barely changes within a session
+    (connectivity checks, package installs) the mtime fingerprint is the
+    wrong invalidation signal - editing a model should not re-run them.
+    Entries expire after ttl_seconds; mtimes of key_files (relative to
+    project_dir) are part of the key so edits to those re-run
+    immediately. Wrapped tools gain a cache_bust kwarg to force a fresh
+    run.
+    """
+
+    def deco(fn):
+        cache: Dict[tuple, tuple] = {}
+
+        @functools.wraps(fn)
+        def wrap(project_dir: str, *args, cache_bust: bool = False, **kwargs):
+            mtimes = []
+            for name in key_files:
+                try:
+                    mtimes.append(os.stat(os.path.join(project_dir, name)).st_mtime)
+                except OSError:
+                    mtimes.append(0.0)
+            key = (project_dir, _freeze(args), _freeze(kwargs), tuple(mtimes))
+            now = time.monotonic()
+            if not cache_bust:
+                hit = cache.get(key)
+                if hit is not None and hit[0] > now:
+                    return dict(hit[1])
+            result = fn(project_dir, *args, **kwargs)
+            if result.get("status") == "success":
+                cache[key] = (now + ttl_seconds, result)
+            return result
+
+        return wrap
+
+    return deco
+
+
+def _duckdb_profile(project_dir: str, profiles_dir: Optional[str]) -> bool:
+    """Best-effort check for a DuckDB target without a YAML dependency."""
+    path = os.path.join(profiles_dir or project_dir, "profiles.yml")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return "duckdb" in f.read()
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=32)
+def _dir_args(project_dir: str, profiles_dir: str) -> tuple:
+    """Directory flags, interned once per project instead of per call."""
+    return ("--project-dir", project_dir, "--profiles-dir", profiles_dir)
+
+
+def _command_str(args: List[str]) -> str:
+    """Render the dbt invocation for the response's command field.
+
+    shlex.join quotes arguments like --vars JSON correctly, so the string
+    can be copy-pasted into a shell as-is.
+    """
+    return shlex.join(("dbt", *args))
+
+
+def _invoke_in_process(
+    args: List[str], project_dir: str, profiles_dir: str
+) -> Dict[str, Any]:
+    """Run one dbt command through the in-process dbtRunner.
+
+    stdout/stderr are captured to StringIO so the response shape matches
+    the subprocess path exactly.
+    """
+    out, err = io.StringIO(), io.StringIO()
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            res = _get_runner(project_dir, profiles_dir).invoke(args)
+
+        stderr = err.getvalue()
+        if res.exception is not None:
+            stderr = f"{stderr}\n{res.exception}".strip()
+
+        return {
+            "status": "success" if res.success else "error",
+            "return_code": 0 if res.success else 1,
+            "stdout": out.getvalue(),
+            "stderr": stderr,
+            "command": _command_str(args),
+        }
+    except Exception as e:
+        logger.error(f"Error invoking dbt in process: {e}", exc_info=True)
+        return {
+            "status": "error",
+            "return_code": None,
+            "stdout": out.getvalue(),
+            "stderr": str(e),
+            "command": _command_str(args),
+        }
+
 
 def _run_dbt_command(
-    command: List[str],
+    command: Sequence[str],
     project_dir: str,
     profiles_dir: Optional[str] = None,
     vars: Optional[Dict[str, Any]] = None,
     select: Optional[List[str]] = None,
     exclude: Optional[List[str]] = None,
     selector: Optional[str] = None,
+    threads: Optional[int] = None,
+    use_subprocess: bool = False,
+    pool_connections: bool = True,
+    lightweight: bool = False,
 ) -> Dict[str, Any]:
     """Execute a dbt command with common options.
 
@@ -47,41 +338,101 @@ def _run_dbt_command(
         select: List of selectors (e.g., ['model_name', 'tag:staging']).
         exclude: List of resources to exclude.
         selector: Name of a selector from selectors.yml.
+        threads: Worker threads dbt may use for independent nodes
+            (overrides the profiles.yml setting).
+        use_subprocess: Force the dbt CLI subprocess even when the
+            in-process runner is importable.
+        pool_connections: Keep the warehouse adapter connected across
+            in-process invocations instead of reconnecting per command.
+        lightweight: Skip relation-cache population, run-results JSON
+            writes and usage telemetry. Right for read-mostly commands
+            (ls, parse, show...); commands relying on an up-to-date
+            relation cache should leave this off.
 
     Returns:
         Dict with status, return_code, stdout, and stderr.
     """
     profiles_dir = profiles_dir or project_dir
 
-    cmd = ["dbt"] + command + ["--project-dir", project_dir, "--profiles-dir", profiles_dir]
+    args = [
+        *(_LIGHTWEIGHT_FLAGS if lightweight else ()),
+        *command,
+        *_dir_args(project_dir, profiles_dir),
+    ]
 
     if vars:
-        vars_json = json.dumps(vars)
-        cmd.extend(["--vars", vars_json])
+        # Sorted keys keep the serialized vars stable, so semantically
+        # identical calls share a result-cache entry.
+        if orjson is not None:
+            vars_json = orjson.dumps(vars, option=orjson.OPT_SORT_KEYS).decode()
+        else:
+            vars_json = json.dumps(vars, sort_keys=True)
+        args += ("--vars", vars_json)
 
     if select:
-        cmd.extend(["--select"] + select)
+        args += ("--select", *select)
 
     if exclude:
-        cmd.extend(["--exclude"] + exclude)
+        args += ("--exclude", *exclude)
 
     if selector:
-        cmd.extend(["--selector", selector])
+        args += ("--selector", selector)
+
+    if threads is not None:
+        args += ("--threads", str(threads))
+
+    if not use_subprocess and DBT_RUNNER_AVAILABLE:
+        # Non-blocking acquire: if another thread (a dbt_run_many worker)
+        # is already inside the runner, fall through to a subprocess
+        # rather than racing dbt's global state or queueing behind it.
+        if _INPROCESS_LOCK.acquire(blocking=False):
+            try:
+                if pool_connections:
+                    _enable_adapter_pool()
+                return _invoke_in_process(args, project_dir, profiles_dir)
+            finally:
+                _INPROCESS_LOCK.release()
+
+    cmd = ["dbt", *args]
 
     try:
-        result = subprocess.run(
+        # Stream instead of buffering: run(capture_output=True) held every
+        # log line in memory until the process exited. A selector
+        # multiplexes both pipes into bounded deques, so peak memory is
+        # O(tail) rather than O(total log) and early lines of huge runs
+        # are dropped instead of retained.
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            check=False,  # Don't raise on non-zero exit
+            bufsize=1,
         )
+        tails = {
+            proc.stdout: deque(maxlen=_MAX_LOG_LINES),
+            proc.stderr: deque(maxlen=_MAX_LOG_LINES),
+        }
+        sel = selectors.DefaultSelector()
+        sel.register(proc.stdout, selectors.EVENT_READ)
+        sel.register(proc.stderr, selectors.EVENT_READ)
+        open_streams = 2
+        while open_streams:
+            for key, _ in sel.select():
+                line = key.fileobj.readline()
+                if line:
+                    tails[key.fileobj].append(line.rstrip("\n"))
+                else:
+                    sel.unregister(key.fileobj)
+                    open_streams -= 1
+        return_code = proc.wait()
+        sel.close()
 
         return {
-            "status": "success" if result.returncode == 0 else "error",
-            "return_code": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-            "command": " ".join(cmd),
+            "status": "success" if return_code == 0 else "error",
+            "return_code": return_code,
+            "stdout": "\n".join(tails[proc.stdout]),
+            "stderr": "\n".join(tails[proc.stderr]),
+            "command": shlex.join(cmd),
         }
     except Exception as e:
         logger.error(f"Error running dbt command: {e}", exc_info=True)
@@ -90,7 +441,7 @@ def _run_dbt_command(
             "return_code": None,
             "stdout": "",
             "stderr": str(e),
-            "command": " ".join(cmd),
+            "command": shlex.join(cmd),
         }
 
 
@@ -103,6 +454,7 @@ def dbt_run(
     selector: Optional[str] = None,
     vars: Optional[Dict[str, Any]] = None,
     full_refresh: bool = False,
+    threads: Optional[int] = None,
     profiles_dir: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Run dbt models.
@@ -115,6 +467,7 @@ def dbt_run(
         selector: Name of a selector from selectors.yml.
         vars: Dictionary of variables to pass to dbt.
         full_refresh: If True, run with --full-refresh flag.
+        threads: Worker threads for independent models.
         profiles_dir: Path to dbt profiles directory.
 
     Returns:
@@ -128,6 +481,10 @@ def dbt_run(
     if models:
         command.extend(["--models"] + models)
 
+    if threads is not None and threads > 1 and _duckdb_profile(project_dir, profiles_dir):
+        logger.warning("DuckDB targets do not support concurrent writes; forcing threads=1")
+        threads = 1
+
     return _run_dbt_command(
         command=command,
         project_dir=project_dir,
@@ -136,6 +493,7 @@ def dbt_run(
         select=select,
         exclude=exclude,
         selector=selector,
+        threads=threads,
     )
 
 
@@ -146,6 +504,7 @@ def dbt_test(
     exclude: Optional[List[str]] = None,
     selector: Optional[str] = None,
     vars: Optional[Dict[str, Any]] = None,
+    threads: Optional[int] = None,
     profiles_dir: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Run dbt tests (data quality tests).
@@ -156,12 +515,13 @@ def dbt_test(
         exclude: List of resources to exclude.
         selector: Name of a selector from selectors.yml.
         vars: Dictionary of variables to pass to dbt.
+        threads: Worker threads for independent tests.
         profiles_dir: Path to dbt profiles directory.
 
     Returns:
         Dict with test results.
     """
-    command = ["test"]
+    command = ("test",)
 
     return _run_dbt_command(
         command=command,
@@ -171,10 +531,12 @@ def dbt_test(
         select=select,
         exclude=exclude,
         selector=selector,
+        threads=threads,
     )
 
 
 @agent_tool
+@_mtime_cached
 def dbt_compile(
     project_dir: str,
     select: Optional[List[str]] = None,
@@ -196,7 +558,7 @@ def dbt_compile(
     Returns:
         Dict with compilation results.
     """
-    command = ["compile"]
+    command = ("compile",)
 
     return _run_dbt_command(
         command=command,
@@ -206,6 +568,7 @@ def dbt_compile(
         select=select,
         exclude=exclude,
         selector=selector,
+        lightweight=True,
     )
 
 
@@ -217,6 +580,7 @@ def dbt_build(
     selector: Optional[str] = None,
     vars: Optional[Dict[str, Any]] = None,
     full_refresh: bool = False,
+    threads: Optional[int] = None,
     profiles_dir: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Run dbt build (runs models and tests in a single operation).
@@ -228,6 +592,7 @@ def dbt_build(
         selector: Name of a selector from selectors.yml.
         vars: Dictionary of variables to pass to dbt.
         full_refresh: If True, run with --full-refresh flag.
+        threads: Worker threads for independent nodes.
         profiles_dir: Path to dbt profiles directory.
 
     Returns:
@@ -246,6 +611,7 @@ def dbt_build(
         select=select,
         exclude=exclude,
         selector=selector,
+        threads=threads,
     )
 
 
@@ -263,7 +629,7 @@ def dbt_docs_generate(
     Returns:
         Dict with generation results.
     """
-    command = ["docs", "generate"]
+    command = ("docs", "generate")
 
     return _run_dbt_command(
         command=command,
@@ -272,13 +638,22 @@ def dbt_docs_generate(
     )
 
 
+# Background docs servers by PID, so dbt_docs_stop can find them again.
+_DOC_SERVERS: Dict[int, subprocess.Popen] = {}
+
+
 @agent_tool
 def dbt_docs_serve(
     project_dir: str,
     port: int = 8080,
     profiles_dir: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Serve dbt documentation (starts a local web server).
+    """Serve dbt documentation from a background web server.
+
+    The server used to be launched with a blocking wait, which parked the
+    agent until the process was killed. It is now started detached and
+    the call returns immediately with the PID; stop it with
+    dbt_docs_stop.
 
     Args:
         project_dir: Path to dbt project directory.
@@ -286,21 +661,89 @@ def dbt_docs_serve(
         profiles_dir: Path to dbt profiles directory.
 
     Returns:
-        Dict with server information.
+        Dict with the server PID and URL.
     """
-    command = ["docs", "serve", "--port", str(port)]
+    profiles_dir = profiles_dir or project_dir
+    cmd = [
+        "dbt", "docs", "serve", "--port", str(port),
+        "--project-dir", project_dir,
+        "--profiles-dir", profiles_dir,
+    ]
 
-    result = _run_dbt_command(
-        command=command,
-        project_dir=project_dir,
-        profiles_dir=profiles_dir,
-    )
+    try:
+        # stderr goes to DEVNULL too: nothing ever reads a pipe here, and
+        # a full pipe buffer would block the server mid-write.
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        # Give a server that dies on startup (e.g. the port is already
+        # bound) a moment to exit, so the failure surfaces now rather
+        # than as a dead PID on first use.
+        time.sleep(0.5)
+        if proc.poll() is not None:
+            return {
+                "status": "error",
+                "error": (
+                    f"dbt docs server exited immediately with code "
+                    f"{proc.returncode} (is port {port} already in use?)"
+                ),
+            }
+        _DOC_SERVERS[proc.pid] = proc
 
-    if result["status"] == "success":
-        result["message"] = f"dbt docs server started on http://localhost:{port}"
-        result["note"] = "This is a blocking operation. Use dbt_docs_generate to create docs without serving."
+        return {
+            "status": "success",
+            "pid": proc.pid,
+            "url": f"http://localhost:{port}",
+            "message": f"dbt docs server started on http://localhost:{port}",
+            "note": "Runs in the background. Stop it with dbt_docs_stop(pid).",
+        }
+    except Exception as e:
+        logger.error(f"Error starting dbt docs server: {e}", exc_info=True)
+        return {
+            "status": "error",
+            "error": str(e),
+        }
 
-    return result
+
+@agent_tool
+def dbt_docs_stop(pid: int) -> Dict[str, Any]:
+    """Stop a background dbt docs server started by dbt_docs_serve.
+
+    Args:
+        pid: Process ID returned by dbt_docs_serve.
+
+    Returns:
+        Dict with the shutdown result.
+    """
+    proc = _DOC_SERVERS.pop(pid, None)
+    if proc is None:
+        return {
+            "status": "error",
+            "error": f"No docs server with PID {pid} was started by this process",
+        }
+
+    try:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+        return {
+            "status": "success",
+            "pid": pid,
+            "return_code": proc.returncode,
+        }
+    except Exception as e:
+        logger.error(f"Error stopping dbt docs server: {e}", exc_info=True)
+        return {
+            "status": "error",
+            "error": str(e),
+        }
 
 
 @agent_tool
@@ -309,6 +752,7 @@ def dbt_seed(
     select: Optional[List[str]] = None,
     exclude: Optional[List[str]] = None,
     vars: Optional[Dict[str, Any]] = None,
+    threads: Optional[int] = None,
     profiles_dir: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Load seed data from CSV files into the data warehouse.
@@ -318,12 +762,13 @@ def dbt_seed(
         select: List of seed files to load.
         exclude: List of seed files to exclude.
         vars: Dictionary of variables to pass to dbt.
+        threads: Worker threads for independent seeds.
         profiles_dir: Path to dbt profiles directory.
 
     Returns:
         Dict with seed results.
     """
-    command = ["seed"]
+    command = ("seed",)
 
     return _run_dbt_command(
         command=command,
@@ -332,6 +777,7 @@ def dbt_seed(
         vars=vars,
         select=select,
         exclude=exclude,
+        threads=threads,
     )
 
 
@@ -341,6 +787,7 @@ def dbt_snapshot(
     select: Optional[List[str]] = None,
     exclude: Optional[List[str]] = None,
     vars: Optional[Dict[str, Any]] = None,
+    threads: Optional[int] = None,
     profiles_dir: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Run dbt snapshots (for SCD Type 2 tracking).
@@ -350,12 +797,13 @@ def dbt_snapshot(
         select: List of snapshots to run.
         exclude: List of snapshots to exclude.
         vars: Dictionary of variables to pass to dbt.
+        threads: Worker threads for independent snapshots.
         profiles_dir: Path to dbt profiles directory.
 
     Returns:
         Dict with snapshot results.
     """
-    command = ["snapshot"]
+    command = ("snapshot",)
 
     return _run_dbt_command(
         command=command,
@@ -364,10 +812,12 @@ def dbt_snapshot(
         vars=vars,
         select=select,
         exclude=exclude,
+        threads=threads,
     )
 
 
 @agent_tool
+@_mtime_cached
 def dbt_ls(
     project_dir: str,
     select: Optional[List[str]] = None,
@@ -387,9 +837,10 @@ def dbt_ls(
         profiles_dir: Path to dbt profiles directory.
 
     Returns:
-        Dict with list of resources.
+        Dict with list of resource dicts (name, resource_type,
+        package_name, original_file_path, ...).
     """
-    command = ["ls"]
+    command = ["ls", "--output", "json"]
 
     if resource_type:
         command.extend(["--resource-type", resource_type])
@@ -401,10 +852,21 @@ def dbt_ls(
         select=select,
         exclude=exclude,
         selector=selector,
+        lightweight=True,
     )
 
     if result["status"] == "success" and result["stdout"]:
-        resources = [line.strip() for line in result["stdout"].split("\n") if line.strip()]
+        # One JSON document per line; dbt interleaves the listing with
+        # plain log lines (deprecation notices etc.), which are skipped.
+        loads = orjson.loads if orjson is not None else json.loads
+        resources = []
+        for line in result["stdout"].splitlines():
+            if not line.startswith("{"):
+                continue
+            try:
+                resources.append(loads(line))
+            except ValueError:
+                continue
         result["resources"] = resources
         result["count"] = len(resources)
 
@@ -439,45 +901,60 @@ def dbt_show(
         profiles_dir=profiles_dir,
         vars=vars,
         select=select,
+        lightweight=True,
     )
 
 
 @agent_tool
+@_ttl_cached(300)
 def dbt_debug(
     project_dir: str,
     profiles_dir: Optional[str] = None,
+    cache_bust: bool = False,
 ) -> Dict[str, Any]:
     """Debug dbt project and profile configuration.
 
+    Successful results are reused for five minutes, so repeated
+    connectivity checks within a session are free.
+
     Args:
         project_dir: Path to dbt project directory.
         profiles_dir: Path to dbt profiles directory.
+        cache_bust: If True, re-run the check even if a recent result is
+            cached.
 
     Returns:
         Dict with debug information.
     """
-    command = ["debug"]
+    command = ("debug",)
 
     return _run_dbt_command(
         command=command,
         project_dir=project_dir,
         profiles_dir=profiles_dir,
+        lightweight=True,
     )
 
 
 @agent_tool
+@_ttl_cached(3600, key_files=("packages.yml",))
 def dbt_deps(
     project_dir: str,
+    cache_bust: bool = False,
 ) -> Dict[str, Any]:
     """Install dbt package dependencies.
 
+    A successful install is reused for an hour, or until packages.yml
+    changes on disk.
+
     Args:
         project_dir: Path to dbt project directory.
+        cache_bust: If True, reinstall even if a recent result is cached.
 
     Returns:
         Dict with installation results.
     """
-    command = ["deps"]
+    command = ("deps",)
 
     return _run_dbt_command(
         command=command,
@@ -519,6 +996,7 @@ def dbt_source_freshness(
     select: Optional[List[str]] = None,
     exclude: Optional[List[str]] = None,
     vars: Optional[Dict[str, Any]] = None,
+    threads: Optional[int] = None,
     profiles_dir: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Check source data freshness (when sources were last updated).
@@ -528,12 +1006,13 @@ def dbt_source_freshness(
         select: List of sources to check.
         exclude: List of sources to exclude.
         vars: Dictionary of variables to pass to dbt.
+        threads: Worker threads for independent sources.
         profiles_dir: Path to dbt profiles directory.
 
     Returns:
         Dict with freshness check results.
     """
-    command = ["source", "freshness"]
+    command = ("source", "freshness")
 
     return _run_dbt_command(
         command=command,
@@ -542,10 +1021,12 @@ def dbt_source_freshness(
         vars=vars,
         select=select,
         exclude=exclude,
+        threads=threads,
     )
 
 
 @agent_tool
+@_mtime_cached
 def dbt_parse(
     project_dir: str,
     profiles_dir: Optional[str] = None,
@@ -559,11 +1040,74 @@ def dbt_parse(
     Returns:
         Dict with parse results.
     """
-    command = ["parse"]
+    command = ("parse",)
 
     return _run_dbt_command(
         command=command,
         project_dir=project_dir,
         profiles_dir=profiles_dir,
+        lightweight=True,
     )
 
+
+
+# Keyword names _run_dbt_command accepts, for validating batch specs.
+_RUN_DBT_PARAMS = frozenset(inspect.signature(_run_dbt_command).parameters)
+
+
+def _run_spec(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one dbt_run_many spec, containing failures in the result dict."""
+    unknown = set(spec) - _RUN_DBT_PARAMS
+    if unknown:
+        return {
+            "status": "error",
+            "return_code": None,
+            "stdout": "",
+            "stderr": f"Unknown keys in command spec: {sorted(unknown)}",
+            "command": None,
+        }
+    try:
+        return _run_dbt_command(**spec)
+    except Exception as e:
+        logger.error(f"Error running batched dbt command: {e}", exc_info=True)
+        return {
+            "status": "error",
+            "return_code": None,
+            "stdout": "",
+            "stderr": str(e),
+            "command": None,
+        }
+
+
+@agent_tool
+def dbt_run_many(commands: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Run several independent dbt commands concurrently.
+
+    Startup sanity checks like parse + debug + ls otherwise execute
+    serially, each blocking on I/O. The specs are fanned out over a
+    thread pool (dbt waits are I/O bound), so total latency approaches
+    the slowest single command. dbt-core does not support concurrent
+    in-process invocations, so at most one batch member uses the
+    in-process runner at a time; the rest run as dbt subprocesses. Only
+    batch commands that do not depend on each other - e.g. never pair
+    deps with run.
+
+    Args:
+        commands: Command specs. Each entry is a keyword dict for
+            _run_dbt_command and needs at least 'command' (list of dbt
+            args, e.g. ['parse']) and 'project_dir'.
+
+    Returns:
+        Dict with per-command results in input order.
+    """
+    if not commands:
+        return {"status": "success", "count": 0, "results": []}
+
+    max_workers = min(8, os.cpu_count() or 1, len(commands))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(_run_spec, commands))
+
+    overall = "success" if all(
+        r.get("status") == "success" for r in results
+    ) else "error"
+    return {"status": overall, "count": len(results), "results": results}
@@ -20,6 +20,7 @@ and reading files with various options (head, tail, or full content).
 """
 
 import json
+from itertools import islice
 from typing import Any, Dict, List, Optional
 from google.cloud import storage
 import sys
@@ -201,28 +202,33 @@ def read_gcs_file_tool(
   try:
     client = get_gcs_client()
     bucket = client.bucket(bucket_name)
-    blob = bucket.blob(file_path)
+    # get_blob checks existence and fetches metadata in one request;
+    # blob.exists() would cost a separate round trip and leave size,
+    # content_type etc. unpopulated.
+    blob = bucket.get_blob(file_path)
 
-    if not blob.exists():
+    if blob is None:
       return {
           "status": "error",
           "error": f"File {file_path} does not exist in bucket {bucket_name}",
       }
 
-    # Read the file content
-    content = blob.download_as_text()
-    lines = content.splitlines()
-
     # Process based on mode
     if mode == "head":
-      result_lines = lines[:num_lines]
+      # Stream just the lines needed instead of downloading the whole
+      # object - for large files this transfers a few KB, not the blob.
+      with blob.open("r") as f:
+        result_lines = [line.rstrip("\n") for line in islice(f, num_lines)]
       position = "start"
-    elif mode == "tail":
-      result_lines = lines[-num_lines:]
-      position = "end"
-    else:  # full
-      result_lines = lines
-      position = "full"
+    else:
+      content = blob.download_as_text()
+      lines = content.splitlines()
+      if mode == "tail":
+        result_lines = lines[-num_lines:]
+        position = "end"
+      else:  # full
+        result_lines = lines
+        position = "full"
 
     return {
         "status": "success",
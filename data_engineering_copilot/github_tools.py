@@ -20,7 +20,8 @@ making commits, and creating pull requests in GitHub repositories.
 
 from typing import Any, Dict, List, Optional
 from google.adk.tools import agent_tool
-from github import Github, GithubException
+from github import Github, GithubException, InputGitTreeElement
+import functools
 import sys
 import os
 
@@ -28,13 +29,26 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import config
 
+from . import _http
+from ._tool_cache import cached_read_tool, invalidate_group
+
+
+@functools.lru_cache(maxsize=4)
+def _build_github_client(github_token: str) -> Github:
+    """Build one pooled GitHub client per token and reuse it across calls.
+
+    PyGithub keeps its urllib3 pool on the client instance, so recreating the
+    client per tool call would renegotiate TLS on every request.
+    """
+    return Github(github_token, pool_size=_http.POOL_MAXSIZE)
+
 
 def _get_github_client() -> Optional[Github]:
     """Get GitHub client instance using token from config."""
     github_token = config.github_token
     if not github_token:
         return None
-    return Github(github_token)
+    return _build_github_client(github_token)
 
 
 def _get_repo() -> Optional[Any]:
@@ -138,6 +152,7 @@ def create_github_repository(
 
 
 @agent_tool
+@cached_read_tool(group="github_reads")
 def read_file_from_github(file_path: str, branch: Optional[str] = None) -> str:
     """Read a file from the GitHub repository.
 
@@ -168,6 +183,105 @@ def read_file_from_github(file_path: str, branch: Optional[str] = None) -> str:
         return error_msg
 
 
+_GRAPHQL_URL = "https://api.github.com/graphql"
+# GitHub caps aliased fields well above this, but keep batches modest so a
+# single oversized response doesn't dominate memory or hit secondary limits.
+_GRAPHQL_BATCH_SIZE = 50
+
+
+@agent_tool
+def read_files_from_github(
+    file_paths: List[str],
+    branch: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Read multiple files from the GitHub repository in a single request.
+
+    Prefer this over calling read_file_from_github in a loop: all paths are
+    fetched through one GraphQL query (in batches of 50 aliased blob fields),
+    so reading N files costs one round trip instead of N.
+
+    Args:
+        file_paths (List[str]): Paths of the files to read (e.g.,
+            ['definitions/sources/apple_ads.sqlx', 'workflow_settings.yaml']).
+        branch (Optional[str]): The branch to read from. Defaults to the
+            configured default branch.
+
+    Returns:
+        Dict[str, Any]: Mapping of path to content under 'files', plus any
+        per-file errors under 'errors'.
+    """
+    github_token = config.github_token
+    repo_path = config.github_repo_path
+    if not github_token or not repo_path:
+        return {
+            "status": "error",
+            "error_message": "GitHub repository not configured. Please set GITHUB_TOKEN and GITHUB_REPO_PATH environment variables.",
+        }
+
+    if not branch:
+        branch = config.github_default_branch
+
+    owner, _, name = repo_path.partition("/")
+    session = _http.get_shared_session()
+    files: Dict[str, str] = {}
+    errors: Dict[str, str] = {}
+
+    try:
+        for start in range(0, len(file_paths), _GRAPHQL_BATCH_SIZE):
+            batch = file_paths[start:start + _GRAPHQL_BATCH_SIZE]
+            variables: Dict[str, str] = {"owner": owner, "name": name}
+            fields = []
+            for i, path in enumerate(batch):
+                variables[f"expr{i}"] = f"{branch}:{path}"
+                fields.append(
+                    f"f{i}: object(expression: $expr{i}) {{ ... on Blob {{ text }} }}"
+                )
+            query = (
+                "query($owner: String!, $name: String!, "
+                + ", ".join(f"$expr{i}: String!" for i in range(len(batch)))
+                + ") { repository(owner: $owner, name: $name) { "
+                + " ".join(fields)
+                + " } }"
+            )
+
+            response = session.post(
+                _GRAPHQL_URL,
+                json={"query": query, "variables": variables},
+                headers={"Authorization": f"bearer {github_token}"},
+                timeout=30,
+            )
+            response.raise_for_status()
+            payload = response.json()
+            if payload.get("errors"):
+                return {
+                    "status": "error",
+                    "error_message": f"GraphQL error: {payload['errors']}",
+                }
+
+            repository = payload["data"]["repository"]
+            for i, path in enumerate(batch):
+                blob = repository.get(f"f{i}")
+                if blob is None:
+                    errors[path] = f"File '{path}' not found on branch '{branch}'"
+                elif blob.get("text") is None:
+                    errors[path] = f"File '{path}' is binary or too large for GraphQL"
+                else:
+                    files[path] = blob["text"]
+
+        return {
+            "status": "success" if not errors else "partial",
+            "branch": branch,
+            "files": files,
+            "errors": errors or None,
+            "count": len(files),
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "error_message": f"Error reading files from GitHub: {e}",
+        }
+
+
 @agent_tool
 def write_file_to_github(
     file_path: str,
@@ -186,6 +300,8 @@ def write_file_to_github(
     Returns:
         Dict[str, Any]: Result of the write operation including status and commit SHA.
     """
+    # This mutates the repo, so cached reads may now be stale.
+    invalidate_group("github_reads")
     repo = _get_repo()
     if not repo:
         return {
@@ -237,6 +353,67 @@ def write_file_to_github(
         return {"status": "error", "error_message": error_msg}
 
 
+@agent_tool
+def write_files_to_github(
+    files: List[Dict[str, str]],
+    commit_message: str,
+    branch: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Write or update several files in the repository as one atomic commit.
+
+    Prefer this over calling write_file_to_github in a loop: the Contents API
+    costs three requests per file (existence check, blob, commit), while this
+    builds one tree with all files through the Git Data API - a constant four
+    requests regardless of file count - and produces a single commit, which
+    is also nicer for PR review.
+
+    Args:
+        files (List[Dict[str, str]]): Files to write, each as a dict with
+            'path' and 'content' keys.
+        commit_message (str): The commit message for the combined change.
+        branch (Optional[str]): The branch to write to. Defaults to the
+            configured default branch.
+
+    Returns:
+        Dict[str, Any]: Result of the write including status and commit SHA.
+    """
+    # This mutates the repo, so cached reads may now be stale.
+    invalidate_group("github_reads")
+    repo = _get_repo()
+    if not repo:
+        return {
+            "status": "error",
+            "error_message": "GitHub repository not configured. Please set GITHUB_TOKEN and GITHUB_REPO_PATH environment variables.",
+        }
+
+    if not branch:
+        branch = config.github_default_branch
+
+    try:
+        ref = repo.get_git_ref(f"heads/{branch}")
+        base_commit = repo.get_git_commit(ref.object.sha)
+        tree_elements = [
+            InputGitTreeElement(
+                path=f["path"], mode="100644", type="blob", content=f["content"]
+            )
+            for f in files
+        ]
+        tree = repo.create_git_tree(tree_elements, base_tree=base_commit.tree)
+        commit = repo.create_git_commit(commit_message, tree, [base_commit])
+        ref.edit(commit.sha)
+        return {
+            "status": "success",
+            "message": f"{len(files)} file(s) committed to branch '{branch}'",
+            "commit_sha": commit.sha,
+            "files_written": [f["path"] for f in files],
+            "branch": branch,
+        }
+    except (GithubException, KeyError) as e:
+        error_msg = f"Error writing {len(files)} file(s) to branch '{branch}': {e}"
+        print(error_msg)
+        return {"status": "error", "error_message": error_msg}
+
+
 @agent_tool
 def create_github_branch(
     branch_name: str, source_branch: Optional[str] = None
@@ -331,6 +508,7 @@ def create_github_pull_request(
 
 
 @agent_tool
+@cached_read_tool(group="github_reads")
 def list_github_files(
     path: str = "", branch: Optional[str] = None
 ) -> List[str]:
@@ -363,6 +541,7 @@ def list_github_files(
 
 
 @agent_tool
+@cached_read_tool(group="github_reads")
 def get_github_file_history(
     file_path: str, branch: Optional[str] = None, limit: int = 10
 ) -> Dict[str, Any]:
@@ -432,6 +611,8 @@ def sync_dataform_to_github(
     Returns:
         Dict[str, Any]: Result of the sync operation.
     """
+    # This mutates the repo, so cached reads may now be stale.
+    invalidate_group("github_reads")
     from .dataform_tools import read_file_from_dataform
     
     # Read from Dataform
@@ -468,6 +649,8 @@ def delete_github_branch(branch_name: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Result of the branch deletion operation.
     """
+    # This mutates the repo, so cached reads may now be stale.
+    invalidate_group("github_reads")
     repo = _get_repo()
     if not repo:
         return {
@@ -506,6 +689,7 @@ def delete_github_branch(branch_name: str) -> Dict[str, Any]:
 
 
 @agent_tool
+@cached_read_tool(group="github_reads")
 def get_merged_pull_requests(
     base_branch: Optional[str] = None, limit: int = 10
 ) -> Dict[str, Any]:
@@ -576,6 +760,8 @@ def cleanup_merged_branches(
     Returns:
         Dict[str, Any]: Result of the cleanup operation with list of deleted/would-be-deleted branches.
     """
+    # This mutates the repo, so cached reads may now be stale.
+    invalidate_group("github_reads")
     repo = _get_repo()
     if not repo:
         return {